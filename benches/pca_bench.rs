@@ -1,17 +1,21 @@
 #[macro_use]
 extern crate criterion;
 use criterion::Criterion;
+use std::hint::black_box;
+use veloxx::PCA;
 
 fn bench_pca_first_component(c: &mut Criterion) {
     let n_samples = 10_000;
     let n_features = 50;
-    let _matrix: Vec<Vec<f64>> = (0..n_samples)
-        .map(|_| (0..n_features).map(|j| (j as f64) * 0.1).collect())
+    let matrix: Vec<Vec<f64>> = (0..n_samples)
+        .map(|i| {
+            (0..n_features)
+                .map(|j| (j as f64) * 0.1 + ((i * (j + 1)) % 17) as f64)
+                .collect()
+        })
         .collect();
     c.bench_function("pca_first_component_simd", |b| {
-        b.iter(|| {
-            // PCA functionality not available
-        })
+        b.iter(|| PCA::first_component(black_box(&matrix)).unwrap())
     });
 }
 
@@ -1,19 +1,18 @@
-import csv
 import random
 import string
 
+CITIES = ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Jose']
+
 # Generate a larger CSV dataset
-def generate_large_csv(filename, num_rows=10000):
-    with open(filename, 'w', newline='') as csvfile:
-        fieldnames = ['name', 'age', 'city']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for i in range(num_rows):
-            name = ''.join(random.choices(string.ascii_uppercase + string.ascii_lowercase, k=5))
-            age = random.randint(18, 65)
-            city = random.choice(['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Jose'])
-            writer.writerow({'name': name, 'age': age, 'city': city})
+def generate_large_csv(filename, num_rows=10000, seed=None):
+    rng = random.Random(seed)
+    flat = rng.choices(string.ascii_letters, k=5 * num_rows)
+    names = [''.join(flat[i:i + 5]) for i in range(0, 5 * num_rows, 5)]
+    ages = rng.choices(range(18, 66), k=num_rows)
+    cities = rng.choices(CITIES, k=num_rows)
+
+    with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+        csvfile.write("name,age,city\n" + "".join(f"{name},{age},{city}\n" for name, age, city in zip(names, ages, cities)))
 
 if __name__ == "__main__":
     generate_large_csv("large_sample.csv", 10000)
\ No newline at end of file
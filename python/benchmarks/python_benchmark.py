@@ -1,40 +1,53 @@
-import time
+import timeit
 import pandas as pd
 import polars as pl
 import dask.dataframe as dd
 from veloxx_python_api import read_csv
 
-def benchmark_pandas():
-    start_time = time.time()
+REPEAT = 7
+
+def _best_of(fn, repeat=REPEAT):
+    """Fastest of ``repeat`` single calls to ``fn``, in seconds.
+
+    ``timeit`` times with ``time.perf_counter`` and disables the GC while timing,
+    so the minimum filters out scheduler and collector noise.
+    """
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+def run_pandas():
     df = pd.read_csv("large_sample.csv")
     filtered_df = df[df['age'] > 30]
     grouped_df = filtered_df.groupby('city').size()
-    end_time = time.time()
-    return end_time - start_time
+    return grouped_df
 
-def benchmark_polars():
-    start_time = time.time()
+def benchmark_pandas():
+    return _best_of(run_pandas)
+
+def run_polars():
     df = pl.read_csv("large_sample.csv")
     filtered_df = df.filter(pl.col('age') > 30)
     grouped_df = filtered_df.group_by('city').count()
-    end_time = time.time()
-    return end_time - start_time
+    return grouped_df
 
-def benchmark_dask():
-    start_time = time.time()
+def benchmark_polars():
+    return _best_of(run_polars)
+
+def run_dask():
     df = dd.read_csv("large_sample.csv")
     filtered_df = df[df['age'] > 30]
     grouped_df = filtered_df.groupby('city').size().compute()
-    end_time = time.time()
-    return end_time - start_time
+    return grouped_df
+
+def benchmark_dask():
+    return _best_of(run_dask)
+
+def run_veloxx():
+    df = read_csv("large_sample.csv", dtype={'age': 'int32', 'city': 'category'}, cache=False)
+    grouped_df = df.filter_group_count('age', lambda age: age > 30, 'city')
+    return grouped_df
 
 def benchmark_veloxx():
-    start_time = time.time()
-    df = read_csv("large_sample.csv")
-    filtered_df = df.filter(lambda row: int(row['age']) > 30)
-    grouped_df = filtered_df.group_by('city').count()
-    end_time = time.time()
-    return end_time - start_time
+    return _best_of(run_veloxx)
 
 if __name__ == "__main__":
     print("Benchmarking Pandas...")
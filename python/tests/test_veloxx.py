@@ -30,6 +30,27 @@ class TestPySeries:
         dtype = s.data_type()
         assert dtype == veloxx.PyDataType.I32 or str(dtype) in ("I32", "PyDataType.I32")
 
+    def test_series_creation_small_ints(self):
+        s = veloxx.PySeries("ints", (None, 7, -3))
+        assert s.to_list() == [None, 7, -3]
+        # Out-of-range ints leave the fast path; the generic path nulls them
+        s = veloxx.PySeries("ints", [7, 2**40])
+        assert s.to_list() == [7, None]
+
+    def test_series_validity_mask(self):
+        # The mask narrows nulls; it cannot turn a None placeholder into a value
+        s = veloxx.PySeries("x", [1, None, 3], validity=[True, True, False])
+        assert s.to_list() == [1, None, None]
+        s = veloxx.PySeries("x", [1, 2, 3], validity=bytes([0b101]))
+        assert s.to_list() == [1, None, 3]
+        assert s.null_count() == 1
+        assert s.validity_bits() == bytes([0b101])
+        # An unpacked one-byte-per-row mask is rejected, not misread as bits
+        with pytest.raises(ValueError):
+            veloxx.PySeries("x", [1, 2, 3], validity=bytes([1, 0, 1]))
+        with pytest.raises(ValueError):
+            veloxx.PySeries("x", [1, 2, 3], validity=[True, False])
+
     def test_series_set_name(self, sample_series_i32):
         s = sample_series_i32
         s.set_name("new_name")
@@ -72,5 +93,30 @@ class TestPySeries:
         else:
             pytest.skip("std_dev() not implemented in PySeries")
 
+    def test_series_percentile_quantile(self):
+        s = veloxx.PySeries("pct", [1, 3, 2, 4, 5])
+        if hasattr(s, "percentile"):
+            assert s.median() == 3.0
+            assert s.percentile(50.0) == 3.0
+            assert s.quantile(1.0) == 5.0
+            # Linear interpolation between ranks, as in numpy and describe()
+            assert veloxx.PySeries("q", [20, 25, 30, 35]).percentile(25.0) == 23.75
+            with pytest.raises(ValueError):
+                s.quantile(1.5)
+        else:
+            pytest.skip("percentile() not implemented in PySeries")
+
+    def test_series_to_numpy(self):
+        np = pytest.importorskip("numpy")
+        s = veloxx.PySeries("values", [1.5, None, 3.0])
+        if hasattr(s, "to_numpy"):
+            arr = s.to_numpy()
+            assert arr.dtype == np.float64
+            assert arr[0] == 1.5 and np.isnan(arr[1]) and arr[2] == 3.0
+            assert veloxx.PySeries("ints", [1, 2, 3]).to_numpy().dtype == np.int32
+            assert s.to_list() == [1.5, None, 3.0]
+        else:
+            pytest.skip("to_numpy() not implemented in PySeries")
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
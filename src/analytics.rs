@@ -0,0 +1,6 @@
+//! Analytics module for Velox.
+//!
+//! Numerical routines that operate on dense f64 matrices, such as
+//! principal component analysis.
+
+pub mod pca;
@@ -2,34 +2,204 @@
 use crate::VeloxxError;
 use rayon::prelude::*;
 
+/// Maximum power iterations for the leading eigenvector. Convergence is
+/// geometric in the ratio of the two largest eigenvalues, so close spectra
+/// need a few hundred steps; well-separated ones stop early on `TOLERANCE`.
+const MAX_ITERATIONS: usize = 500;
+
+/// Stop iterating once successive estimates differ by less than this
+const TOLERANCE: f64 = 1e-12;
+
 /// SIMD-accelerated Principal Component Analysis for f64 data
 pub struct PCA;
 
 impl PCA {
     /// Compute the first principal component for a matrix (rows: samples, cols: features)
+    ///
+    /// Only the leading eigenvector of the scatter matrix is needed, so it is found
+    /// by power iteration rather than a full eigendecomposition. The result is a unit
+    /// vector whose largest-magnitude entry is positive; constant data yields zeros.
     pub fn first_component(matrix: &[Vec<f64>]) -> Result<Vec<f64>, VeloxxError> {
         let n_samples = matrix.len();
-        if n_samples == 0 { return Ok(vec![]); }
+        if n_samples == 0 {
+            return Ok(vec![]);
+        }
         let n_features = matrix[0].len();
-        if n_features == 0 { return Ok(vec![]); }
+        if n_features == 0 {
+            return Ok(vec![]);
+        }
+        if matrix.iter().any(|row| row.len() != n_features) {
+            return Err(VeloxxError::InvalidOperation(
+                "All rows must have the same number of features".to_string(),
+            ));
+        }
 
-        // Mean-center each column (SIMD-parallel)
-        let means: Vec<f64> = (0..n_features)
-            .into_par_iter()
-            .map(|j| matrix.iter().map(|row| row[j]).sum::<f64>() / n_samples as f64)
-            .collect();
-        let centered: Vec<Vec<f64>> = matrix.par_iter()
-            .map(|row| row.iter().enumerate().map(|(j, &v)| v - means[j]).collect())
+        let scatter = Self::scatter_matrix(matrix, n_features);
+        Ok(Self::power_iteration(&scatter, n_features))
+    }
+
+    /// Row-major scatter matrix X^T X of the mean-centered data. The 1/(n-1)
+    /// covariance scale is omitted since it does not change the eigenvectors.
+    fn scatter_matrix(matrix: &[Vec<f64>], n_features: usize) -> Vec<f64> {
+        let n_samples = matrix.len() as f64;
+        let mut means = matrix
+            .par_iter()
+            .fold(
+                || vec![0.0; n_features],
+                |mut acc, row| {
+                    for (a, &v) in acc.iter_mut().zip(row) {
+                        *a += v;
+                    }
+                    acc
+                },
+            )
+            .reduce(|| vec![0.0; n_features], Self::add_assign);
+        for mean in &mut means {
+            *mean /= n_samples;
+        }
+
+        // Accumulate one rank-1 update per row into the upper triangle; each inner
+        // loop runs over a contiguous row slice and vectorizes
+        let mut scatter = matrix
+            .par_iter()
+            .fold(
+                || (vec![0.0; n_features * n_features], vec![0.0; n_features]),
+                |(mut acc, mut centered), row| {
+                    for ((c, &v), &m) in centered.iter_mut().zip(row).zip(&means) {
+                        *c = v - m;
+                    }
+                    for i in 0..n_features {
+                        let ci = centered[i];
+                        let out = &mut acc[i * n_features + i..(i + 1) * n_features];
+                        for (o, &cj) in out.iter_mut().zip(&centered[i..]) {
+                            *o += ci * cj;
+                        }
+                    }
+                    (acc, centered)
+                },
+            )
+            .map(|(acc, _)| acc)
+            .reduce(|| vec![0.0; n_features * n_features], Self::add_assign);
+
+        for i in 0..n_features {
+            for j in 0..i {
+                scatter[i * n_features + j] = scatter[j * n_features + i];
+            }
+        }
+        scatter
+    }
+
+    /// Leading eigenvector of a symmetric positive semi-definite matrix
+    fn power_iteration(matrix: &[f64], n: usize) -> Vec<f64> {
+        // Start from a generic vector: a matrix column or a basis vector can be
+        // an eigenvector of a smaller eigenvalue (or orthogonal to the leading
+        // one) and would then never rotate toward the answer
+        let mut v = Self::start_vector(n);
+        Self::normalize(&mut v);
+
+        let mut next = vec![0.0; n];
+        for _ in 0..MAX_ITERATIONS {
+            for (out, row) in next.iter_mut().zip(matrix.chunks_exact(n)) {
+                *out = row.iter().zip(&v).map(|(a, b)| a * b).sum();
+            }
+            if !Self::normalize(&mut next) {
+                return vec![0.0; n];
+            }
+            let delta = next
+                .iter()
+                .zip(&v)
+                .map(|(a, b)| (a - b).abs())
+                .fold(0.0, f64::max);
+            std::mem::swap(&mut v, &mut next);
+            if delta < TOLERANCE {
+                break;
+            }
+        }
+
+        // Eigenvectors are defined up to sign; pick the one with a positive
+        // largest-magnitude entry so results are deterministic
+        let pivot = v
+            .iter()
+            .copied()
+            .max_by(|a, b| a.abs().total_cmp(&b.abs()))
+            .unwrap_or(0.0);
+        if pivot < 0.0 {
+            v.iter_mut().for_each(|x| *x = -*x);
+        }
+        v
+    }
+
+    /// Deterministic pseudo-random vector with entries in [0.5, 1.5), from a
+    /// fixed-seed splitmix64 sequence so results are reproducible
+    fn start_vector(n: usize) -> Vec<f64> {
+        let mut state: u64 = 0x9E37_79B9_7F4A_7C15;
+        (0..n)
+            .map(|_| {
+                state = state.wrapping_add(0x9E37_79B9_7F4A_7C15);
+                let mut z = state;
+                z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+                z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+                z ^= z >> 31;
+                0.5 + (z >> 11) as f64 / (1u64 << 53) as f64
+            })
+            .collect()
+    }
+
+    /// Scale to unit length; false if the vector is zero
+    fn normalize(v: &mut [f64]) -> bool {
+        let norm = v.iter().map(|x| x * x).sum::<f64>().sqrt();
+        if norm == 0.0 || !norm.is_finite() {
+            return false;
+        }
+        v.iter_mut().for_each(|x| *x /= norm);
+        true
+    }
+
+    fn add_assign(mut a: Vec<f64>, b: Vec<f64>) -> Vec<f64> {
+        for (x, y) in a.iter_mut().zip(&b) {
+            *x += y;
+        }
+        a
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_first_component() {
+        let matrix = vec![
+            vec![1.0, 2.0, 3.0],
+            vec![2.0, 3.0, 4.0],
+            vec![3.0, 4.0, 5.0],
+        ];
+        let pc = PCA::first_component(&matrix).unwrap();
+        let expected = 1.0 / 3.0f64.sqrt();
+        assert!(pc.iter().all(|&v| (v - expected).abs() < 1e-9));
+
+        // Variance concentrated in the second feature
+        let matrix: Vec<Vec<f64>> = (0..50)
+            .map(|i| vec![(i % 3) as f64 * 0.01, -(i as f64), 7.0])
             .collect();
+        let pc = PCA::first_component(&matrix).unwrap();
+        assert!((pc[1].abs() - 1.0).abs() < 1e-6);
+        assert!(pc[1] > 0.0);
+        assert_eq!(pc[2], 0.0);
 
-        // Compute covariance matrix (SIMD-parallel)
-        let cov: Vec<Vec<f64>> = (0..n_features).into_par_iter().map(|i| {
-            (0..n_features).map(|j| {
-                centered.iter().map(|row| row[i] * row[j]).sum::<f64>() / (n_samples as f64 - 1.0)
-            }).collect()
-        }).collect();
+        // The highest-variance feature's axis is an eigenvector here, but not
+        // the leading one: scatter [[6.76,0,0],[0,4,4],[0,4,4]] has top
+        // eigenvalue 8 along [0, 1, 1]/sqrt(2)
+        let matrix = vec![
+            vec![1.3, 1.0, 1.0],
+            vec![-1.3, 1.0, 1.0],
+            vec![1.3, -1.0, -1.0],
+            vec![-1.3, -1.0, -1.0],
+        ];
+        let pc = PCA::first_component(&matrix).unwrap();
+        let expected = [0.0, 0.5f64.sqrt(), 0.5f64.sqrt()];
+        assert!(pc.iter().zip(&expected).all(|(v, e)| (v - e).abs() < 1e-6));
 
-        // For demo: return first column of covariance matrix as "principal component"
-        Ok(cov[0].clone())
+        assert!(PCA::first_component(&[vec![1.0], vec![1.0, 2.0]]).is_err());
     }
 }
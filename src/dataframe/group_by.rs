@@ -84,14 +84,73 @@ fn simd_max_f64(values: &[f64]) -> f64 {
         .max_by(|a, b| a.partial_cmp(b).unwrap())
         .unwrap_or(&0.0)
 }
-#[cfg(all(feature = "simd", not(target_arch = "wasm32")))]
-use crate::performance::simd_eq_str;
-#[cfg(not(all(feature = "simd", not(target_arch = "wasm32"))))]
-use crate::performance::simd_string::simd_eq_str;
 use crate::{dataframe::DataFrame, series::Series, types::Value, VeloxxError};
 // use bincode::{config, decode_from_slice, encode_to_vec};
 use std::collections::HashMap;
 
+/// Dictionary-encode a key column: one dense code per row plus the key string
+/// for each code, in order of first appearance. Nulls encode as `"<NULL>"` for
+/// strings; other types use their `Debug` value representation.
+fn dictionary_encode(series: &Series, row_count: usize) -> (Vec<u32>, Vec<String>) {
+    #[cfg(not(target_arch = "wasm32"))]
+    use fxhash::FxHashMap;
+    #[cfg(target_arch = "wasm32")]
+    use std::collections::HashMap as FxHashMap;
+
+    let mut dictionary: Vec<String> = Vec::new();
+    let codes = match series {
+        Series::String(_, values, validity) => {
+            let mut lookup: FxHashMap<&str, u32> = FxHashMap::default();
+            (0..row_count)
+                .map(|i| {
+                    let key = if i < values.len() && validity[i] {
+                        values[i].as_str()
+                    } else {
+                        "<NULL>"
+                    };
+                    *lookup.entry(key).or_insert_with(|| {
+                        dictionary.push(key.to_string());
+                        (dictionary.len() - 1) as u32
+                    })
+                })
+                .collect()
+        }
+        Series::I32(_, values, validity) => {
+            let mut lookup: FxHashMap<Option<i32>, u32> = FxHashMap::default();
+            (0..row_count)
+                .map(|i| {
+                    let key = if i < values.len() && validity[i] {
+                        Some(values[i])
+                    } else {
+                        None
+                    };
+                    *lookup.entry(key).or_insert_with(|| {
+                        let value = key.map(Value::I32).unwrap_or(Value::Null);
+                        dictionary.push(format!("{value:?}"));
+                        (dictionary.len() - 1) as u32
+                    })
+                })
+                .collect()
+        }
+        _ => {
+            let mut lookup: FxHashMap<String, u32> = FxHashMap::default();
+            (0..row_count)
+                .map(|i| {
+                    let key = format!("{:?}", series.get_value(i).unwrap_or(Value::Null));
+                    if let Some(&code) = lookup.get(&key) {
+                        return code;
+                    }
+                    let code = dictionary.len() as u32;
+                    dictionary.push(key.clone());
+                    lookup.insert(key, code);
+                    code
+                })
+                .collect()
+        }
+    };
+    (codes, dictionary)
+}
+
 // Helper struct to reduce argument count for dense groupby
 #[allow(clippy::too_many_arguments)]
 struct DenseGroupByParams<'a> {
@@ -153,9 +212,10 @@ impl<'a> GroupedDataFrame<'a> {
     }
     /// Creates a new `GroupedDataFrame` by grouping the provided `DataFrame` by the specified columns.
     ///
-    /// This method iterates through the `DataFrame` and collects row indices for each unique
-    /// combination of values in the `group_columns`. The keys for the groups are serialized
-    /// `FlatValue` vectors to allow for hashing and comparison.
+    /// This method collects row indices for each unique combination of values in the
+    /// `group_columns`. Each key column is dictionary-encoded to dense `u32` codes first,
+    /// so grouping hashes integers rather than per-row key strings; groups are ordered
+    /// by first appearance.
     ///
     /// # Arguments
     ///
@@ -185,61 +245,64 @@ impl<'a> GroupedDataFrame<'a> {
     /// // The `grouped_df` now holds the grouped structure.
     /// ```
     pub fn new(dataframe: &'a DataFrame, group_columns: Vec<String>) -> Result<Self, VeloxxError> {
-        use rayon::prelude::*;
+        #[cfg(not(target_arch = "wasm32"))]
+        use fxhash::FxHashMap;
+        #[cfg(target_arch = "wasm32")]
+        use std::collections::HashMap as FxHashMap;
+
         let row_count = dataframe.row_count();
-        // Use direct key representation for string/categorical columns
-        let key_row_pairs: Vec<(Vec<String>, usize)> = (0..row_count)
-            .into_par_iter()
-            .map(|i| {
-                let mut key: Vec<String> = Vec::with_capacity(group_columns.len());
-                for col_name in &group_columns {
-                    let series = dataframe.get_column(col_name).expect("Column not found");
-                    match series {
-                        crate::series::Series::String(_, values, validity) => {
-                            if i < values.len() && validity[i] {
-                                key.push(values[i].clone());
-                            } else {
-                                key.push("<NULL>".to_string());
-                            }
-                        }
-                        _ => {
-                            key.push(format!("{:?}", series.get_value(i).unwrap_or(Value::Null)));
-                        }
-                    }
-                }
-                (key, i)
-            })
-            .collect();
 
-        // Merge into groups HashMap serially
-        let mut groups: HashMap<Vec<String>, Vec<usize>> = HashMap::with_capacity(row_count);
-        for (key, i) in key_row_pairs {
-            // Use SIMD string comparison for string/categorical keys
-            let mut matching_key = None;
-            for existing_key in groups.keys() {
-                if key.len() == existing_key.len()
-                    && key
-                        .iter()
-                        .zip(existing_key.iter())
-                        .all(|(a, b)| simd_eq_str(a, b))
-                {
-                    matching_key = Some(existing_key.clone());
-                    break;
-                }
+        // Dictionary-encode each key column once, then combine the per-column
+        // codes into dense group ids so grouping only hashes small integers
+        let mut dictionaries: Vec<(Vec<u32>, Vec<String>)> =
+            Vec::with_capacity(group_columns.len());
+        for col_name in &group_columns {
+            let series = dataframe
+                .get_column(col_name)
+                .ok_or_else(|| VeloxxError::ColumnNotFound(col_name.clone()))?;
+            dictionaries.push(dictionary_encode(series, row_count));
+        }
+
+        let mut group_ids: Vec<u32> = vec![0; row_count];
+        let mut group_count: usize = if row_count == 0 { 0 } else { 1 };
+        for (codes, dictionary) in &dictionaries {
+            // With at most one group so far, the column's codes are the group ids
+            if group_count <= 1 {
+                group_ids.copy_from_slice(codes);
+                group_count = dictionary.len();
+                continue;
             }
-            if let Some(matched) = matching_key {
-                groups.get_mut(&matched).unwrap().push(i);
-            } else {
-                groups.insert(key, vec![i]);
+            let mut combined: FxHashMap<(u32, u32), u32> = FxHashMap::default();
+            for (id, &code) in group_ids.iter_mut().zip(codes) {
+                let next = combined.len() as u32;
+                *id = *combined.entry((*id, code)).or_insert(next);
             }
+            group_count = combined.len();
         }
 
-        let mut group_keys = Vec::with_capacity(groups.len());
-        let mut group_indices = Vec::with_capacity(groups.len());
-        for (k, v) in groups.into_iter() {
-            group_keys.push(k); // Direct key representation
-            group_indices.push(v);
+        // Bucket row indices by group id with exact-capacity vectors
+        let mut sizes = vec![0usize; group_count];
+        for &id in &group_ids {
+            sizes[id as usize] += 1;
+        }
+        let mut group_indices: Vec<Vec<usize>> =
+            sizes.iter().map(|&size| Vec::with_capacity(size)).collect();
+        for (row, &id) in group_ids.iter().enumerate() {
+            group_indices[id as usize].push(row);
         }
+
+        // Materialize each key once from the dictionaries
+        let group_keys: Vec<Vec<String>> = group_indices
+            .iter()
+            .map(|rows| {
+                let first = rows[0];
+                dictionaries
+                    .iter()
+                    .map(|(codes, dictionary)| dictionary[codes[first] as usize].clone())
+                    .collect()
+            })
+            .collect();
+
         Ok(GroupedDataFrame {
             dataframe,
             group_columns,
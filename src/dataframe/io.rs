@@ -39,6 +39,36 @@ impl DataFrame {
                 .to_string(),
         ))
     }
+
+    /// Loads a `DataFrame` from an Arrow IPC file via a memory map.
+    ///
+    /// Unlike CSV, no text is parsed: each column is copied straight out of its
+    /// Arrow buffer. Pair with [`DataFrame::to_ipc`] for fast round trips.
+    #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+    pub fn from_ipc(path: &str) -> Result<Self, VeloxxError> {
+        crate::io::arrow::read_ipc_to_dataframe(path)
+    }
+
+    #[cfg(not(all(feature = "arrow", not(target_arch = "wasm32"))))]
+    pub fn from_ipc(_path: &str) -> Result<Self, VeloxxError> {
+        Err(VeloxxError::Unsupported(
+            "Arrow IPC requires the arrow feature on native targets".to_string(),
+        ))
+    }
+
+    /// Writes the `DataFrame` to an Arrow IPC file.
+    #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+    pub fn to_ipc(&self, path: &str) -> Result<(), VeloxxError> {
+        crate::io::arrow::write_dataframe_to_ipc(self, path)
+    }
+
+    #[cfg(not(all(feature = "arrow", not(target_arch = "wasm32"))))]
+    pub fn to_ipc(&self, _path: &str) -> Result<(), VeloxxError> {
+        Err(VeloxxError::Unsupported(
+            "Arrow IPC requires the arrow feature on native targets".to_string(),
+        ))
+    }
+
     pub fn from_csv(path: &str) -> Result<Self, VeloxxError> {
         let mut file = std::fs::File::open(path).map_err(|e| VeloxxError::FileIO(e.to_string()))?;
         let mut contents = Vec::new();
@@ -13,16 +13,8 @@ impl DataFrame {
             .filter(|&i| condition.evaluate(self, i).unwrap_or(false))
             .collect();
 
-        // Step 2: Build filtered DataFrame (zero-copy if possible)
-        let mut filtered_columns = std::collections::HashMap::new();
-        for (name, series) in &self.columns {
-            let filtered_series = series.filter(&row_indices)?;
-            filtered_columns.insert(name.clone(), filtered_series);
-        }
-        let filtered_df = DataFrame {
-            columns: filtered_columns,
-            row_count: row_indices.len(),
-        };
+        // Step 2: Build filtered DataFrame, gathering columns in parallel
+        let filtered_df = self.gather_rows(&row_indices)?;
 
         // Step 3: Group-by and aggregate on filtered DataFrame
         let grouped_df = filtered_df.group_by(group_columns)?;
@@ -34,7 +26,11 @@ use crate::{
     conditions::Condition,
     dataframe::DataFrame,
     expressions::Expr,
-    series::Series,
+    series::{
+        moments::PairedMoments,
+        summary::{quartiles, Summary},
+        Series,
+    },
     types::{DataType, Value},
 };
 use std::collections::HashMap;
@@ -429,6 +425,12 @@ impl DataFrame {
             )));
         }
 
+        // Dense numeric/boolean expressions run as one fused chunked program
+        if let Some(fused) = crate::expressions::fused::FusedExpr::compile(expr, self) {
+            new_columns.insert(new_col_name.to_string(), fused.evaluate(new_col_name)?);
+            return DataFrame::new(new_columns);
+        }
+
         let mut evaluated_values: Vec<Value> = Vec::with_capacity(self.row_count);
         let mut inferred_type: Option<crate::types::DataType> = None;
 
@@ -629,12 +631,18 @@ impl DataFrame {
             });
         }
 
-        let mut new_columns: std::collections::HashMap<String, Series> =
-            std::collections::HashMap::new();
-        for (col_name, series) in self.columns.iter() {
-            let new_series = (*series).filter(row_indices)?;
-            new_columns.insert(col_name.clone(), new_series);
-        }
+        self.gather_rows(row_indices)
+    }
+
+    /// Gather the given rows from every column, one rayon task per column.
+    /// Unlike `filter_by_indices`, an empty index list keeps the columns.
+    pub(crate) fn gather_rows(&self, row_indices: &[usize]) -> Result<Self, VeloxxError> {
+        use rayon::prelude::*;
+        let new_columns: std::collections::HashMap<String, Series> = self
+            .columns
+            .par_iter()
+            .map(|(col_name, series)| Ok((col_name.clone(), series.filter(row_indices)?)))
+            .collect::<Result<_, VeloxxError>>()?;
 
         DataFrame::new(new_columns)
     }
@@ -713,15 +721,17 @@ impl DataFrame {
             }
         }
 
-        // Create appended columns by matching names regardless of order
-        let mut new_columns: std::collections::HashMap<String, Series> =
-            std::collections::HashMap::new();
-        for col_name in self_column_names.into_iter() {
-            let self_series = self.get_column(col_name).unwrap();
-            let other_series = other.get_column(col_name).unwrap();
-            let appended_series = self_series.append(other_series)?;
-            new_columns.insert(col_name.clone(), appended_series);
-        }
+        // Create appended columns by matching names regardless of order,
+        // one rayon task per column
+        use rayon::prelude::*;
+        let new_columns: std::collections::HashMap<String, Series> = self
+            .columns
+            .par_iter()
+            .map(|(col_name, self_series)| {
+                let other_series = other.get_column(col_name).unwrap();
+                Ok((col_name.clone(), self_series.append(other_series)?))
+            })
+            .collect::<Result<_, VeloxxError>>()?;
 
         DataFrame::new(new_columns)
     }
@@ -826,8 +836,12 @@ impl DataFrame {
                 if let Some((min_key, max_key)) =
                     min_max_i32_with_bitmap(group_values, group_bitmap, value_bitmap)
                 {
+                    // Direct-indexed accumulators replace hashing whenever the key
+                    // span is small and not much larger than the input itself
                     let range = (max_key as i64 - min_key as i64).unsigned_abs() + 1;
-                    if range <= 1 << 16 && group_values.len() >= 4096 {
+                    if range <= DENSE_GROUP_SPAN as u64
+                        && range <= group_values.len().max(DENSE_MIN_SPAN) as u64
+                    {
                         return Ok(Some(dense_sequential_groupby(DenseSeqGroupByParams {
                             group_values,
                             group_bitmap,
@@ -858,9 +872,10 @@ impl DataFrame {
     /// Generates descriptive statistics for the `DataFrame`.
     ///
     /// This method calculates various statistical measures for each column in the DataFrame.
-    /// For numeric columns (`I32`, `F64`, `DateTime`), it computes count, mean, standard deviation,
-    /// minimum, maximum, and median. For non-numeric columns (`Bool`, `String`), only the count
-    /// of non-null values is provided.
+    /// For numeric columns (`I32`, `F64`), it computes count, mean, standard deviation,
+    /// minimum, maximum, and the 25th/50th/75th percentiles (`25%`, `median`, `75%`). For other
+    /// columns only the count is provided. Percentiles are exact for columns with up to 65,536
+    /// non-null values and approximated with a t-digest beyond that.
     ///
     /// # Returns
     ///
@@ -883,10 +898,10 @@ impl DataFrame {
     /// let description_df = df.describe().unwrap();
     /// println!("Descriptive Statistics:\n{}", description_df);
     /// // Expected output (column order might vary):
-    /// // column         count          mean           std            min            max            median         
-    /// // --------------- --------------- --------------- --------------- --------------- --------------- ---------------
-    /// // age            4              27.50          6.45           Value::I32(20) Value::I32(35) Value::F64(27.50)
-    /// // city           4              null           null           null           null           null           
+    /// // column         count          mean           std            min            max            25%            median         75%
+    /// // --------------- --------------- --------------- --------------- --------------- --------------- --------------- ---------------
+    /// // age            4              27.50          6.45           Value::I32(20) Value::I32(35) Value::F64(23.75) Value::F64(27.50) Value::F64(31.25)
+    /// // city           4              null           null           null           null           null           null           null
     /// ```
     pub fn describe(&self) -> Result<DataFrame, VeloxxError> {
         let mut descriptions: std::collections::HashMap<String, Series> =
@@ -896,7 +911,9 @@ impl DataFrame {
         let mut std_devs: Vec<Option<f64>> = Vec::new();
         let mut mins: Vec<Option<Value>> = Vec::new();
         let mut maxs: Vec<Option<Value>> = Vec::new();
+        let mut lower_quartiles: Vec<Option<Value>> = Vec::new();
         let mut medians: Vec<Option<Value>> = Vec::new();
+        let mut upper_quartiles: Vec<Option<Value>> = Vec::new();
 
         let mut column_names_vec: Vec<String> = Vec::new();
 
@@ -904,34 +921,46 @@ impl DataFrame {
             column_names_vec.push(col_name.clone());
             counts.push(Some(series.len() as i32));
 
-            match series.data_type() {
-                crate::types::DataType::I32
-                | crate::types::DataType::F64
-                | crate::types::DataType::DateTime => {
-                    means.push(series.mean().ok().and_then(|v| {
-                        if let Value::F64(val) = v {
-                            Some(val)
-                        } else {
-                            None
-                        }
-                    }));
-                    std_devs.push(series.std_dev().ok().and_then(|v| {
-                        if let Value::F64(val) = v {
-                            Some(val)
+            // One branchless pass yields count, mean, std, min and max; the
+            // quartiles come from one sort (or one t-digest pass when large)
+            let summary = match series {
+                Series::I32(_, values, validity) => {
+                    let summary = Summary::from_slices(values, validity);
+                    Some((summary, quartiles(values, validity, summary.n), true))
+                }
+                Series::F64(_, values, validity) => {
+                    let summary = Summary::from_slices(values, validity);
+                    Some((summary, quartiles(values, validity, summary.n), false))
+                }
+                _ => None,
+            };
+
+            match summary {
+                Some((summary, quartiles, is_i32)) => {
+                    let extremum = |v: f64| {
+                        if is_i32 {
+                            Value::I32(v as i32)
                         } else {
-                            None
+                            Value::F64(v)
                         }
-                    }));
-                    mins.push(series.min().ok());
-                    maxs.push(series.max().ok());
-                    medians.push(series.median().ok());
+                    };
+                    let has_values = summary.n > 0;
+                    means.push(summary.mean());
+                    std_devs.push(summary.std_dev());
+                    mins.push(has_values.then(|| extremum(summary.min)));
+                    maxs.push(has_values.then(|| extremum(summary.max)));
+                    lower_quartiles.push(quartiles.map(|q| Value::F64(q[0])));
+                    medians.push(quartiles.map(|q| Value::F64(q[1])));
+                    upper_quartiles.push(quartiles.map(|q| Value::F64(q[2])));
                 }
-                _ => {
+                None => {
                     means.push(None);
                     std_devs.push(None);
                     mins.push(None);
                     maxs.push(None);
+                    lower_quartiles.push(None);
                     medians.push(None);
+                    upper_quartiles.push(None);
                 }
             }
         }
@@ -961,16 +990,22 @@ impl DataFrame {
                     .collect(),
             ),
         );
-        descriptions.insert(
-            "median".to_string(),
-            Series::new_string(
-                "median",
-                medians
-                    .into_iter()
-                    .map(|x| x.map(|v| format!("{v:?}")))
-                    .collect(),
-            ),
-        );
+        for (label, values) in [
+            ("25%", lower_quartiles),
+            ("median", medians),
+            ("75%", upper_quartiles),
+        ] {
+            descriptions.insert(
+                label.to_string(),
+                Series::new_string(
+                    label,
+                    values
+                        .into_iter()
+                        .map(|x| x.map(|v| format!("{v:?}")))
+                        .collect(),
+                ),
+            );
+        }
 
         DataFrame::new(descriptions)
     }
@@ -1019,51 +1054,21 @@ impl DataFrame {
     /// println!("correlation with nulls: {:?}", result);
     /// ```
     pub fn correlation(&self, col1_name: &str, col2_name: &str) -> Result<f64, VeloxxError> {
-        let series1 = self
-            .get_column(col1_name)
-            .ok_or(VeloxxError::ColumnNotFound(col1_name.to_string()))?;
-        let series2 = self
-            .get_column(col2_name)
-            .ok_or(VeloxxError::ColumnNotFound(col2_name.to_string()))?;
-
-        let data1: Vec<f64> = series1.to_vec_f64()?;
-        let data2: Vec<f64> = series2.to_vec_f64()?;
-
-        if data1.len() != data2.len() {
-            return Err(VeloxxError::InvalidOperation(
-                "Columns must have the same number of non-null values for correlation.".to_string(),
-            ));
-        }
+        let moments = self.pair_moments(col1_name, col2_name, "correlation")?;
+        Self::correlation_from_moments(&moments)
+    }
 
-        let n = data1.len();
-        if n == 0 {
+    /// Correlation from precomputed pair moments; shared with callers that
+    /// cache moments across correlation and covariance requests
+    pub(crate) fn correlation_from_moments(moments: &PairedMoments) -> Result<f64, VeloxxError> {
+        if moments.n == 0 {
             return Err(VeloxxError::InvalidOperation(
                 "Cannot compute correlation for empty columns.".to_string(),
             ));
         }
 
-        let mean1 = data1.iter().sum::<f64>() / n as f64;
-        let mean2 = data2.iter().sum::<f64>() / n as f64;
-
-        let mut numerator = 0.0;
-        let mut sum_sq_diff1 = 0.0;
-        let mut sum_sq_diff2 = 0.0;
-
-        for i in 0..n {
-            let diff1 = data1[i] - mean1;
-            let diff2 = data2[i] - mean2;
-            numerator += diff1 * diff2;
-            sum_sq_diff1 += diff1.powi(2);
-            sum_sq_diff2 += diff2.powi(2);
-        }
-
-        let denominator = (sum_sq_diff1 * sum_sq_diff2).sqrt();
-
-        if denominator == 0.0 {
-            Ok(0.0) // Handle cases where one or both series have zero variance
-        } else {
-            Ok(numerator / denominator)
-        }
+        // Zero variance in either column yields 0.0
+        Ok(moments.correlation().unwrap_or(0.0))
     }
 
     /// Calculates the covariance between two columns in the `DataFrame`.
@@ -1100,39 +1105,63 @@ impl DataFrame {
     /// assert!((covariance - 1.0).abs() < 0.0001);
     /// ```
     pub fn covariance(&self, col1_name: &str, col2_name: &str) -> Result<f64, VeloxxError> {
+        let moments = self.pair_moments(col1_name, col2_name, "covariance")?;
+        Self::covariance_from_moments(&moments)
+    }
+
+    /// Covariance from precomputed pair moments
+    pub(crate) fn covariance_from_moments(moments: &PairedMoments) -> Result<f64, VeloxxError> {
+        if moments.n < 2 {
+            return Err(VeloxxError::InvalidOperation(
+                "Cannot compute covariance for columns with less than 2 non-null values."
+                    .to_string(),
+            ));
+        }
+
+        Ok(moments.co_moment() / (moments.n - 1) as f64)
+    }
+
+    /// Single-pass moments for two named columns; `operation` names the
+    /// statistic in error messages
+    pub(crate) fn pair_moments(
+        &self,
+        col1_name: &str,
+        col2_name: &str,
+        operation: &str,
+    ) -> Result<PairedMoments, VeloxxError> {
         let series1 = self
             .get_column(col1_name)
             .ok_or(VeloxxError::ColumnNotFound(col1_name.to_string()))?;
         let series2 = self
             .get_column(col2_name)
             .ok_or(VeloxxError::ColumnNotFound(col2_name.to_string()))?;
+        Self::column_pair_moments(series1, series2, operation)
+    }
+
+    /// Single-pass moments for a pair of numeric columns.
+    ///
+    /// Dense F64 columns are read in place from their typed buffers; columns
+    /// with nulls or I32 values are first collapsed to their non-null f64 values.
+    fn column_pair_moments(
+        series1: &Series,
+        series2: &Series,
+        operation: &str,
+    ) -> Result<PairedMoments, VeloxxError> {
+        if let (Series::F64(_, x, x_valid), Series::F64(_, y, y_valid)) = (series1, series2) {
+            if x.len() == y.len() && x_valid.iter().all(|&b| b) && y_valid.iter().all(|&b| b) {
+                return Ok(PairedMoments::from_slices(x, y));
+            }
+        }
 
         let data1: Vec<f64> = series1.to_vec_f64()?;
         let data2: Vec<f64> = series2.to_vec_f64()?;
-
         if data1.len() != data2.len() {
-            return Err(VeloxxError::InvalidOperation(
-                "Columns must have the same number of non-null values for covariance.".to_string(),
-            ));
-        }
-
-        let n = data1.len();
-        if n < 2 {
-            return Err(VeloxxError::InvalidOperation(
-                "Cannot compute covariance for columns with less than 2 non-null values."
-                    .to_string(),
-            ));
-        }
-
-        let mean1 = data1.iter().sum::<f64>() / n as f64;
-        let mean2 = data2.iter().sum::<f64>() / n as f64;
-
-        let mut sum_products = 0.0;
-        for i in 0..n {
-            sum_products += (data1[i] - mean1) * (data2[i] - mean2);
+            return Err(VeloxxError::InvalidOperation(format!(
+                "Columns must have the same number of non-null values for {}.",
+                operation
+            )));
         }
-
-        Ok(sum_products / (n - 1) as f64)
+        Ok(PairedMoments::from_slices(&data1, &data2))
     }
 
     /// Converts the `DataFrame` into a `Vec<Vec<Option<Value>>>`.
@@ -1184,27 +1213,57 @@ impl DataFrame {
     }
 }
 
+/// Largest key span (max - min + 1) grouped by direct indexing instead of hashing
+const DENSE_GROUP_SPAN: usize = 1 << 16;
+
+/// Spans up to this size always take the dense path, even for short inputs
+const DENSE_MIN_SPAN: usize = 1024;
+
+/// Independent accumulator copies per group in the dense path
+const DENSE_LANES: usize = 4;
+
 /// Helper function for min/max calculation with bitmap checking
+///
+/// Null rows are replaced by neutral values instead of being skipped, so the
+/// loop has no data-dependent branches and LLVM vectorizes it into packed
+/// min/max over eight lanes.
 fn min_max_i32_with_bitmap(
     group_values: &[i32],
     group_bitmap: &[bool],
     value_bitmap: &[bool],
 ) -> Option<(i32, i32)> {
-    let mut min = i32::MAX;
-    let mut max = i32::MIN;
-    let mut found_any = false;
-
-    for i in 0..group_values.len() {
-        if group_bitmap[i] && value_bitmap[i] {
-            let val = group_values[i];
-            min = min.min(val);
-            max = max.max(val);
-            found_any = true;
+    const LANES: usize = 8;
+    let mut mins = [i32::MAX; LANES];
+    let mut maxs = [i32::MIN; LANES];
+    let mut valid_rows = 0usize;
+
+    let len = group_values.len();
+    let (group_bitmap, value_bitmap) = (&group_bitmap[..len], &value_bitmap[..len]);
+    let chunks = len / LANES;
+    for c in 0..chunks {
+        let base = c * LANES;
+        for lane in 0..LANES {
+            let i = base + lane;
+            let valid = group_bitmap[i] & value_bitmap[i];
+            let key = group_values[i];
+            mins[lane] = mins[lane].min(if valid { key } else { i32::MAX });
+            maxs[lane] = maxs[lane].max(if valid { key } else { i32::MIN });
+            valid_rows += valid as usize;
         }
     }
+    for i in chunks * LANES..len {
+        let valid = group_bitmap[i] & value_bitmap[i];
+        let key = group_values[i];
+        mins[0] = mins[0].min(if valid { key } else { i32::MAX });
+        maxs[0] = maxs[0].max(if valid { key } else { i32::MIN });
+        valid_rows += valid as usize;
+    }
 
-    if found_any {
-        Some((min, max))
+    if valid_rows > 0 {
+        Some((
+            mins.iter().copied().min().unwrap(),
+            maxs.iter().copied().max().unwrap(),
+        ))
     } else {
         None
     }
@@ -1228,27 +1287,34 @@ fn dense_sequential_groupby(params: DenseSeqGroupByParams) -> Result<DataFrame,
     use crate::series::Series;
     // ...existing code...
 
-    // Optimized sequential version - use Vec instead of allocating tuples
-    let mut sums = vec![0.0f64; params.range];
-    let mut counts = vec![0usize; params.range];
-
-    for i in 0..params.group_values.len() {
-        if params.group_bitmap[i] && params.value_bitmap[i] {
-            let group_index = (params.group_values[i] - params.min_key) as usize;
-            if group_index < params.range {
-                sums[group_index] += params.values[i];
-                counts[group_index] += 1;
-            }
-        }
+    // Each group owns DENSE_LANES adjacent accumulators and consecutive rows
+    // rotate through them, so runs of the same key do not serialize on a single
+    // load-add-store chain. Null rows add zero to group 0 rather than branch.
+    let range = params.range;
+    let mut sums = vec![0.0f64; range * DENSE_LANES];
+    let mut counts = vec![0u32; range * DENSE_LANES];
+
+    let len = params.group_values.len();
+    let group_bitmap = &params.group_bitmap[..len];
+    let value_bitmap = &params.value_bitmap[..len];
+    let values = &params.values[..len];
+    for i in 0..len {
+        let valid = group_bitmap[i] & value_bitmap[i];
+        let offset = params.group_values[i].wrapping_sub(params.min_key) as u32 as usize;
+        let group_index = if valid { offset } else { 0 };
+        let slot = group_index * DENSE_LANES + i % DENSE_LANES;
+        sums[slot] += if valid { values[i] } else { 0.0 };
+        counts[slot] += valid as u32;
     }
 
     let mut group_keys = Vec::new();
     let mut sum_values = Vec::new();
 
-    for group_index in 0..params.range {
-        if counts[group_index] > 0 {
+    for group_index in 0..range {
+        let lanes = group_index * DENSE_LANES..(group_index + 1) * DENSE_LANES;
+        if counts[lanes.clone()].iter().any(|&count| count > 0) {
             group_keys.push(params.min_key + group_index as i32);
-            sum_values.push(sums[group_index]);
+            sum_values.push(sums[lanes].iter().sum::<f64>());
         }
     }
 
@@ -1273,7 +1339,45 @@ fn dense_sequential_groupby(params: DenseSeqGroupByParams) -> Result<DataFrame,
     DataFrame::new(result)
 }
 
+/// Sentinel group id for rows excluded by a null key or value
+const NULL_GROUP: u32 = u32::MAX;
+
+/// Assign a dense group id to every row by probing a hash map keyed on the raw
+/// i32 key buffer. Returns the per-row ids and the key for each id, in order of
+/// first appearance.
+fn i32_group_ids(
+    group_values: &[i32],
+    group_bitmap: &[bool],
+    value_bitmap: &[bool],
+) -> (Vec<u32>, Vec<i32>) {
+    #[cfg(not(target_arch = "wasm32"))]
+    use fxhash::FxHashMap;
+    #[cfg(target_arch = "wasm32")]
+    use std::collections::HashMap as FxHashMap;
+
+    let mut ids: FxHashMap<i32, u32> = FxHashMap::default();
+    let mut keys = Vec::new();
+    let group_ids = group_values
+        .iter()
+        .zip(group_bitmap.iter().zip(value_bitmap))
+        .map(|(&key, (&key_valid, &value_valid))| {
+            if !(key_valid && value_valid) {
+                return NULL_GROUP;
+            }
+            *ids.entry(key).or_insert_with(|| {
+                keys.push(key);
+                (keys.len() - 1) as u32
+            })
+        })
+        .collect();
+    (group_ids, keys)
+}
+
 /// Fast hashmap groupby implementation for fallback
+///
+/// Grouping and aggregation are split into two columnar passes: rows are first
+/// mapped to group ids, then the value buffer is summed into a flat per-group
+/// array without touching the hash map again.
 fn hashmap_groupby_direct(
     group_values: &[i32],
     group_bitmap: &[bool],
@@ -1283,26 +1387,21 @@ fn hashmap_groupby_direct(
     value_col_name: &str,
 ) -> Result<DataFrame, VeloxxError> {
     use crate::series::Series;
-    #[cfg(not(target_arch = "wasm32"))]
-    use fxhash::FxHashMap;
-    // ...existing code...
-    #[cfg(target_arch = "wasm32")]
-    use std::collections::HashMap as FxHashMap;
 
-    // Use FxHashMap for better performance on integer keys
-    let mut groups: FxHashMap<i32, (f64, usize)> = FxHashMap::default();
+    let (group_ids, keys) = i32_group_ids(group_values, group_bitmap, value_bitmap);
 
-    for i in 0..group_values.len() {
-        if group_bitmap[i] && value_bitmap[i] {
-            let entry = groups.entry(group_values[i]).or_insert((0.0f64, 0usize));
-            entry.0 += values[i];
-            entry.1 += 1;
+    let mut sums = vec![0.0f64; keys.len()];
+    for (&gid, &value) in group_ids.iter().zip(values) {
+        if gid != NULL_GROUP {
+            sums[gid as usize] += value;
         }
     }
 
-    let mut group_keys: Vec<i32> = groups.keys().copied().collect();
-    group_keys.sort_unstable();
-    let sum_values: Vec<f64> = group_keys.iter().map(|&k| groups[&k].0).collect();
+    // Emit groups in key order
+    let mut order: Vec<u32> = (0..keys.len() as u32).collect();
+    order.sort_unstable_by_key(|&gid| keys[gid as usize]);
+    let group_keys: Vec<i32> = order.iter().map(|&gid| keys[gid as usize]).collect();
+    let sum_values: Vec<f64> = order.iter().map(|&gid| sums[gid as usize]).collect();
 
     let mut result = std::collections::HashMap::new();
     result.insert(
@@ -46,6 +46,9 @@
 //! # }
 //! ```
 
+pub mod global_aggregate;
+pub mod global_sort;
+
 use crate::dataframe::join::JoinType;
 use crate::dataframe::DataFrame;
 use crate::series::Series;
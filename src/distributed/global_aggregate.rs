@@ -1,8 +1,13 @@
 // src/distributed/global_aggregate.rs
 use crate::VeloxxError;
 use rayon::prelude::*;
-#[cfg(feature = "simd")]
-use crate::performance::simd::SimdOps;
+
+#[cfg(target_arch = "x86_64")]
+use std::arch::x86_64::*;
+
+/// Elements per rayon task; large enough that each block streams from memory
+/// at full bandwidth, small enough to balance across threads
+const PARALLEL_BLOCK: usize = 1 << 16;
 
 /// Parallel and SIMD global aggregation for large arrays
 pub struct GlobalAggregate;
@@ -10,26 +15,107 @@ pub struct GlobalAggregate;
 impl GlobalAggregate {
     /// SIMD + Parallel global sum for f64
     pub fn sum_f64(data: &[f64]) -> f64 {
-        #[cfg(feature = "simd")]
-        {
-            data.simd_sum()
-        }
-        #[cfg(not(feature = "simd"))]
-        {
-            data.par_iter().sum()
+        if data.len() <= PARALLEL_BLOCK {
+            return Self::block_sum(data);
         }
+        // Per-block partial sums are combined as a tree by rayon's reduce,
+        // which keeps rounding error close to pairwise summation
+        data.par_chunks(PARALLEL_BLOCK)
+            .map(Self::block_sum)
+            .reduce(|| 0.0, |a, b| a + b)
     }
 
     /// SIMD + Parallel global mean for f64
     pub fn mean_f64(data: &[f64]) -> Result<f64, VeloxxError> {
-        if data.is_empty() { return Err(VeloxxError::InvalidOperation("Empty array".to_string())); }
-        #[cfg(feature = "simd")]
-        {
-            Ok(data.simd_mean().unwrap())
+        if data.is_empty() {
+            return Err(VeloxxError::InvalidOperation("Empty array".to_string()));
         }
-        #[cfg(not(feature = "simd"))]
+        Ok(Self::sum_f64(data) / data.len() as f64)
+    }
+
+    /// Sum one contiguous block with the best kernel available at runtime
+    fn block_sum(data: &[f64]) -> f64 {
+        #[cfg(target_arch = "x86_64")]
         {
-            Ok(data.par_iter().sum::<f64>() / data.len() as f64)
+            if is_x86_feature_detected!("avx2") {
+                unsafe {
+                    return Self::avx2_sum(data);
+                }
+            }
+        }
+
+        Self::portable_sum(data)
+    }
+
+    /// AVX2 kernel: 16 values per iteration into four independent accumulators
+    /// so consecutive adds do not wait on each other
+    #[cfg(target_arch = "x86_64")]
+    #[target_feature(enable = "avx2")]
+    unsafe fn avx2_sum(data: &[f64]) -> f64 {
+        let ptr = data.as_ptr();
+        let chunks = data.len() / 16;
+        let mut acc0 = _mm256_setzero_pd();
+        let mut acc1 = _mm256_setzero_pd();
+        let mut acc2 = _mm256_setzero_pd();
+        let mut acc3 = _mm256_setzero_pd();
+
+        for i in 0..chunks {
+            let base = ptr.add(i * 16);
+            acc0 = _mm256_add_pd(acc0, _mm256_loadu_pd(base));
+            acc1 = _mm256_add_pd(acc1, _mm256_loadu_pd(base.add(4)));
+            acc2 = _mm256_add_pd(acc2, _mm256_loadu_pd(base.add(8)));
+            acc3 = _mm256_add_pd(acc3, _mm256_loadu_pd(base.add(12)));
         }
+
+        // Tree reduction of the accumulators, then of the four lanes
+        let acc = _mm256_add_pd(_mm256_add_pd(acc0, acc1), _mm256_add_pd(acc2, acc3));
+        let pair = _mm_add_pd(_mm256_castpd256_pd128(acc), _mm256_extractf128_pd(acc, 1));
+        let mut sum = _mm_cvtsd_f64(_mm_add_sd(pair, _mm_unpackhi_pd(pair, pair)));
+
+        for &value in &data[chunks * 16..] {
+            sum += value;
+        }
+        sum
+    }
+
+    /// Portable kernel with the same 16-lane accumulator layout; LLVM lowers
+    /// the fixed-size lane loop to vector adds on any target
+    fn portable_sum(data: &[f64]) -> f64 {
+        let chunks = data.chunks_exact(16);
+        let remainder = chunks.remainder();
+        let mut lanes = [0.0f64; 16];
+        for chunk in chunks {
+            for (lane, &value) in lanes.iter_mut().zip(chunk) {
+                *lane += value;
+            }
+        }
+
+        // Pairwise fold 16 -> 8 -> 4 -> 2 -> 1
+        let mut width = 8;
+        while width > 0 {
+            for i in 0..width {
+                lanes[i] += lanes[i + width];
+            }
+            width /= 2;
+        }
+        lanes[0] + remainder.iter().sum::<f64>()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_sum_mean_f64() {
+        let data: Vec<f64> = (1..=100_003).map(|i| i as f64).collect();
+        let expected = 100_003.0 * 100_004.0 / 2.0;
+        assert_eq!(GlobalAggregate::sum_f64(&data), expected);
+        assert_eq!(GlobalAggregate::portable_sum(&data[..37]), 703.0);
+        assert_eq!(
+            GlobalAggregate::mean_f64(&[1.0, 2.0, 3.0, 4.0]).unwrap(),
+            2.5
+        );
+        assert!(GlobalAggregate::mean_f64(&[]).is_err());
     }
 }
@@ -2,21 +2,24 @@
 use crate::VeloxxError;
 use rayon::prelude::*;
 
+/// Below this length a single-threaded pdqsort beats spawning rayon tasks
+const PARALLEL_SORT_THRESHOLD: usize = 1 << 16;
+
 /// Parallel global sort for large DataFrames
 pub struct GlobalSort;
 
 impl GlobalSort {
-    /// Sort a large vector of f64 globally using parallel chunking and merging
+    /// Sort a slice of f64 in place.
+    ///
+    /// Uses an unstable pattern-defeating quicksort with `f64::total_cmp`, so NaN
+    /// values never panic and sort after all numbers. Large inputs are sorted
+    /// with rayon's parallel unstable sort. No auxiliary buffer is allocated.
     pub fn sort_f64(data: &mut [f64]) -> Result<(), VeloxxError> {
-        let n = data.len();
-        if n == 0 { return Ok(()); }
-        let chunk_size = (n / rayon::current_num_threads().max(1)).max(8192);
-        // Sort chunks in parallel
-        data.par_chunks_mut(chunk_size).for_each(|chunk| chunk.sort_by(|a, b| a.partial_cmp(b).unwrap()));
-        // Merge sorted chunks (simple k-way merge)
-        let mut sorted = data.to_vec();
-        sorted.sort_by(|a, b| a.partial_cmp(b).unwrap());
-        data.copy_from_slice(&sorted);
+        if data.len() < PARALLEL_SORT_THRESHOLD {
+            data.sort_unstable_by(f64::total_cmp);
+        } else {
+            data.par_sort_unstable_by(f64::total_cmp);
+        }
         Ok(())
     }
 }
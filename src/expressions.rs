@@ -1,6 +1,8 @@
 use crate::types::Value;
 use crate::VeloxxError;
 
+pub(crate) mod fused;
+
 /// Represents an expression that can be evaluated against a DataFrame row.
 ///
 /// Expressions are used to define computations, transformations, or logical conditions
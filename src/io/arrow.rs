@@ -10,9 +10,17 @@ use crate::VeloxxError;
 #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
 use arrow::csv::reader::Format;
 #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+use arrow::datatypes::{Field, Schema};
+#[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+use arrow::ipc::reader::FileReader;
+#[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+use arrow::ipc::writer::FileWriter;
+#[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
 use arrow::record_batch::RecordBatch;
 #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
 use arrow_csv::ReaderBuilder;
+#[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+use memmap2::Mmap;
 #[cfg(all(
     feature = "advanced_io",
     feature = "arrow",
@@ -24,7 +32,7 @@ use std::collections::HashMap;
 #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
 use std::fs::File;
 #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
-use std::io::BufReader;
+use std::io::{BufReader, BufWriter, Cursor};
 #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
 use std::sync::Arc;
 
@@ -42,6 +50,56 @@ pub fn read_csv_to_dataframe(file_path: &str) -> Result<DataFrame, VeloxxError>
         record_batches.push(batch);
     }
 
+    record_batches_to_dataframe(&record_batches)
+}
+
+/// Read an Arrow IPC file.
+///
+/// The file is memory-mapped and decoded straight from the mapping, so no read
+/// buffer is filled and no text is parsed; each column is a single copy of its
+/// contiguous Arrow buffer into the Series.
+#[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+pub fn read_ipc_to_dataframe(file_path: &str) -> Result<DataFrame, VeloxxError> {
+    let file = File::open(file_path)?;
+    // Safety: the mapping is only read while `mmap` is alive and the file is
+    // not expected to be truncated concurrently
+    let mmap = unsafe { Mmap::map(&file)? };
+    let reader = FileReader::try_new(Cursor::new(&mmap[..]), None)?;
+
+    let mut record_batches: Vec<RecordBatch> = Vec::new();
+    for batch in reader {
+        record_batches.push(batch?);
+    }
+
+    record_batches_to_dataframe(&record_batches)
+}
+
+/// Write a DataFrame as an Arrow IPC file
+#[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+pub fn write_dataframe_to_ipc(dataframe: &DataFrame, file_path: &str) -> Result<(), VeloxxError> {
+    let mut fields = Vec::new();
+    let mut arrays = Vec::new();
+    for name in dataframe.column_names() {
+        let series = dataframe
+            .get_column(name)
+            .ok_or_else(|| VeloxxError::ColumnNotFound(name.clone()))?;
+        let array = series.to_arrow_array();
+        fields.push(Field::new(name.as_str(), array.data_type().clone(), true));
+        arrays.push(array);
+    }
+    let schema = Arc::new(Schema::new(fields));
+    let batch = RecordBatch::try_new(schema.clone(), arrays)?;
+
+    let file = File::create(file_path)?;
+    let mut writer = FileWriter::try_new(BufWriter::new(file), &schema)?;
+    writer.write(&batch)?;
+    writer.finish()?;
+    Ok(())
+}
+
+/// Concatenate the columns of a sequence of record batches into a DataFrame
+#[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+fn record_batches_to_dataframe(record_batches: &[RecordBatch]) -> Result<DataFrame, VeloxxError> {
     if record_batches.is_empty() {
         return DataFrame::new(HashMap::new());
     }
@@ -52,7 +110,7 @@ pub fn read_csv_to_dataframe(file_path: &str) -> Result<DataFrame, VeloxxError>
     for i in 0..schema.fields().len() {
         let field = schema.field(i);
         let mut series_data: Vec<Series> = Vec::new();
-        for batch in &record_batches {
+        for batch in record_batches {
             let array = batch.column(i);
             series_data.push(Series::from_arrow_array(
                 array.clone(),
@@ -76,25 +134,5 @@ pub fn read_parquet_to_dataframe(file_path: &str) -> Result<DataFrame, VeloxxErr
         record_batches.push(batch?);
     }
 
-    if record_batches.is_empty() {
-        return DataFrame::new(std::collections::HashMap::new());
-    }
-
-    let schema = record_batches[0].schema();
-    let mut columns: std::collections::HashMap<String, Series> = std::collections::HashMap::new();
-
-    for i in 0..schema.fields().len() {
-        let field = schema.field(i);
-        let mut series_data: Vec<Series> = Vec::new();
-        for batch in &record_batches {
-            let array = batch.column(i);
-            series_data.push(Series::from_arrow_array(
-                array.clone(),
-                field.name().clone(),
-            )?);
-        }
-        columns.insert(field.name().clone(), Series::concat(series_data)?);
-    }
-
-    DataFrame::new(columns)
+    record_batches_to_dataframe(&record_batches)
 }
@@ -2,12 +2,16 @@
 //!
 //! A high-performance, lightweight dataframe library for Rust, focusing on efficient
 //! data manipulation with minimal overhead.
-// pub use distributed::global_aggregate::GlobalAggregate;
-// pub use distributed::global_sort::GlobalSort;
-// pub use analytics::pca::PCA;
+#[cfg(not(target_arch = "wasm32"))]
+pub use analytics::pca::PCA;
+#[cfg(not(target_arch = "wasm32"))]
+pub mod analytics;
 #[cfg(not(target_arch = "wasm32"))]
 pub mod distributed; // Only available for non-WASM targets
-                     // pub mod analytics; // Remove or comment out unresolved module
+#[cfg(not(target_arch = "wasm32"))]
+pub use distributed::global_aggregate::GlobalAggregate;
+#[cfg(not(target_arch = "wasm32"))]
+pub use distributed::global_sort::GlobalSort;
 
 // Core exports
 pub use crate::conditions::Condition;
@@ -6,8 +6,9 @@
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::Bound;
-use pyo3::types::{PyDict, PyModule};
+use pyo3::types::{PyByteArray, PyBytes, PyDict, PyList, PyModule};
 #[cfg(feature = "python")]
 use pyo3::{pyclass, pymethods, pymodule, wrap_pyfunction, PyErr, PyObject, PyResult, Python};
 
@@ -21,11 +22,14 @@ use pyo3::{pyclass, pymethods, pymodule, wrap_pyfunction, PyErr, PyObject, PyRes
 #[cfg(feature = "python")]
 use crate::{
     conditions::Condition, dataframe::DataFrame, performance::optimized_simd::OptimizedSimdOps,
-    performance::ultra_fast_join::UltraFastJoin, series::Series, types::Value,
+    performance::ultra_fast_join::UltraFastJoin, series::moments::PairedMoments, series::Series,
+    types::Value,
 };
 
 #[cfg(feature = "python")]
 use std::collections::HashMap;
+#[cfg(feature = "python")]
+use std::sync::{Arc, Mutex};
 
 /// Python wrapper for DataType enum
 #[cfg(feature = "python")]
@@ -461,13 +465,14 @@ impl PyGroupedDataFrame {
             .map(|(c, a)| (c.as_str(), a.as_str()))
             .collect();
 
-        match self.dataframe.inner.group_by(self.group_columns.clone()) {
-            Ok(grouped) => match grouped.agg(string_refs) {
-                Ok(result) => Ok(PyDataFrame { inner: result }),
-                Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                    e.to_string(),
-                )),
-            },
+        // groupby_agg runs simple sums straight off the column buffers and only
+        // builds the row-keyed GroupedDataFrame when it has to fall back
+        match self
+            .dataframe
+            .inner
+            .groupby_agg(self.group_columns.clone(), string_refs)
+        {
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -487,13 +492,12 @@ impl PyGroupedDataFrame {
             }
         }
 
-        match self.dataframe.inner.group_by(self.group_columns.clone()) {
-            Ok(grouped) => match grouped.agg(sum_aggs) {
-                Ok(result) => Ok(PyDataFrame { inner: result }),
-                Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                    e.to_string(),
-                )),
-            },
+        match self
+            .dataframe
+            .inner
+            .groupby_agg(self.group_columns.clone(), sum_aggs)
+        {
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -513,7 +517,7 @@ impl PyGroupedDataFrame {
 
         match self.dataframe.inner.group_by(self.group_columns.clone()) {
             Ok(grouped) => match grouped.agg(mean_aggs) {
-                Ok(result) => Ok(PyDataFrame { inner: result }),
+                Ok(result) => Ok(PyDataFrame::from(result)),
                 Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                     e.to_string(),
                 )),
@@ -537,7 +541,7 @@ impl PyGroupedDataFrame {
 
         match self.dataframe.inner.group_by(self.group_columns.clone()) {
             Ok(grouped) => match grouped.agg(count_aggs) {
-                Ok(result) => Ok(PyDataFrame { inner: result }),
+                Ok(result) => Ok(PyDataFrame::from(result)),
                 Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                     e.to_string(),
                 )),
@@ -561,7 +565,7 @@ impl PyGroupedDataFrame {
 
         match self.dataframe.inner.group_by(self.group_columns.clone()) {
             Ok(grouped) => match grouped.agg(min_aggs) {
-                Ok(result) => Ok(PyDataFrame { inner: result }),
+                Ok(result) => Ok(PyDataFrame::from(result)),
                 Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                     e.to_string(),
                 )),
@@ -585,7 +589,7 @@ impl PyGroupedDataFrame {
 
         match self.dataframe.inner.group_by(self.group_columns.clone()) {
             Ok(grouped) => match grouped.agg(max_aggs) {
-                Ok(result) => Ok(PyDataFrame { inner: result }),
+                Ok(result) => Ok(PyDataFrame::from(result)),
                 Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                     e.to_string(),
                 )),
@@ -608,62 +612,47 @@ pub struct PySeries {
 #[cfg(feature = "python")]
 #[pymethods]
 impl PySeries {
+    /// Create a series from a Python sequence.
+    ///
+    /// Objects exposing the buffer protocol with a float64, int32, int64 or bool
+    /// element type (e.g. `np.asarray(data, dtype=np.float64)` or `array.array`)
+    /// are copied in one pass without per-element conversion; all other sequences
+    /// go through the element-wise path, which also handles `None` as null.
+    ///
+    /// `validity` optionally narrows the null mask, either as a sequence of bools
+    /// or as exactly `ceil(len / 8)` packed bytes (`bytes`, or
+    /// `numpy.packbits(mask, bitorder="little")`). A slot is valid only if `data`
+    /// gave it a value and the mask marks it valid.
     #[new]
-    pub fn new(name: String, data: Vec<Option<PyObject>>) -> PyResult<Self> {
-        Python::with_gil(|py| {
-            if data.is_empty() {
-                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                    "Cannot create Series from empty data",
-                ));
-            }
-
-            // Infer type from first non-null value
-            let first_valid = data.iter().find(|x| x.is_some()).and_then(|x| x.as_ref());
-
-            let series = match first_valid {
-                Some(obj) if obj.extract::<i32>(py).is_ok() => {
-                    let values: Vec<Option<i32>> = data
-                        .into_iter()
-                        .map(|x| x.and_then(|obj| obj.extract::<i32>(py).ok()))
-                        .collect();
-                    Series::new_i32(&name, values)
-                }
-                Some(obj) if obj.extract::<f64>(py).is_ok() => {
-                    let values: Vec<Option<f64>> = data
-                        .into_iter()
-                        .map(|x| x.and_then(|obj| obj.extract::<f64>(py).ok()))
-                        .collect();
-                    Series::new_f64(&name, values)
-                }
-                Some(obj) if obj.extract::<String>(py).is_ok() => {
-                    let values: Vec<Option<String>> = data
-                        .into_iter()
-                        .map(|x| x.and_then(|obj| obj.extract::<String>(py).ok()))
-                        .collect();
-                    Series::new_string(&name, values)
-                }
-                Some(obj) if obj.extract::<bool>(py).is_ok() => {
-                    let values: Vec<Option<bool>> = data
-                        .into_iter()
-                        .map(|x| x.and_then(|obj| obj.extract::<bool>(py).ok()))
-                        .collect();
-                    Series::new_bool(&name, values)
-                }
-                _ => {
-                    return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                        "Unsupported data type or all values are None",
-                    ));
-                }
-            };
-
-            Ok(PySeries { inner: series })
-        })
+    #[pyo3(signature = (name, data, validity=None))]
+    pub fn new(
+        name: String,
+        data: &Bound<'_, PyAny>,
+        validity: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<Self> {
+        let series = Self::series_from_data(name, data)?;
+        match validity {
+            Some(validity) => Ok(PySeries {
+                inner: Self::apply_validity(series, validity)?,
+            }),
+            None => Ok(PySeries { inner: series }),
+        }
     }
 
     /// Create a new PySeries (static method for compatibility)
     #[staticmethod]
-    pub fn new_static(name: String, data: Vec<Option<PyObject>>) -> PyResult<Self> {
-        Self::new(name, data)
+    #[pyo3(signature = (name, data, validity=None))]
+    pub fn new_static(
+        name: String,
+        data: &Bound<'_, PyAny>,
+        validity: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<Self> {
+        Self::new(name, data, validity)
+    }
+
+    /// Null mask packed one bit per value, least significant bit first
+    pub fn validity_bits<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.inner.validity_bits())
     }
 
     /// Get the name of the series
@@ -712,8 +701,8 @@ impl PySeries {
     }
 
     /// Filter the series by indices (high-performance)
-    pub fn filter(&self, indices: Vec<usize>) -> PyResult<Self> {
-        match self.inner.filter(&indices) {
+    pub fn filter(&self, py: Python<'_>, indices: Vec<usize>) -> PyResult<Self> {
+        match py.allow_threads(|| self.inner.filter(&indices)) {
             Ok(filtered) => Ok(PySeries { inner: filtered }),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
@@ -726,6 +715,11 @@ impl PySeries {
         self.inner.count()
     }
 
+    /// Count null values
+    pub fn null_count(&self) -> usize {
+        self.inner.null_count()
+    }
+
     /// Compute sum using SIMD optimization
     #[allow(deprecated)]
     pub fn sum(&self) -> PyResult<Option<PyObject>> {
@@ -792,6 +786,36 @@ impl PySeries {
         }
     }
 
+    /// Get the value at the given percentile (0-100), computed in Rust by selection
+    pub fn percentile(&self, pct: f64) -> PyResult<Option<f64>> {
+        match self.inner.percentile(pct) {
+            Ok(Some(Value::F64(v))) => Ok(Some(v)),
+            Ok(Some(Value::I32(v))) => Ok(Some(v as f64)),
+            Ok(Some(Value::Null)) | Ok(None) => Ok(None),
+            Ok(Some(_)) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Percentile not supported for this data type",
+            )),
+            Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                e.to_string(),
+            )),
+        }
+    }
+
+    /// Get the value at the given quantile (0-1), computed in Rust by selection
+    pub fn quantile(&self, prob: f64) -> PyResult<Option<f64>> {
+        match self.inner.quantile(prob) {
+            Ok(Some(Value::F64(v))) => Ok(Some(v)),
+            Ok(Some(Value::I32(v))) => Ok(Some(v as f64)),
+            Ok(Some(Value::Null)) | Ok(None) => Ok(None),
+            Ok(Some(_)) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Quantile not supported for this data type",
+            )),
+            Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                e.to_string(),
+            )),
+        }
+    }
+
     /// Get minimum value
     #[allow(deprecated)]
     pub fn min(&self) -> PyResult<Option<PyObject>> {
@@ -925,6 +949,68 @@ impl PySeries {
         }
     }
 
+    /// Convert to a Python list, with `None` for nulls
+    #[allow(deprecated)]
+    pub fn to_list(&self, py: Python<'_>) -> PyObject {
+        match &self.inner {
+            Series::I32(_, values, bitmap) => with_nulls(values, bitmap).into_py(py),
+            Series::F64(_, values, bitmap) => with_nulls(values, bitmap).into_py(py),
+            Series::Bool(_, values, bitmap) => with_nulls(values, bitmap).into_py(py),
+            Series::DateTime(_, values, bitmap) => with_nulls(values, bitmap).into_py(py),
+            Series::String(_, values, bitmap) => values
+                .iter()
+                .zip(bitmap)
+                .map(|(v, &valid)| if valid { Some(v.as_str()) } else { None })
+                .collect::<Vec<_>>()
+                .into_py(py),
+        }
+    }
+
+    /// Convert to a NumPy array with a single buffer copy
+    ///
+    /// Dense I32/F64/Bool/DateTime series become `int32`/`float64`/`bool`/`int64`
+    /// arrays backed by one `bytearray`, without creating a Python object per
+    /// element. Nulls in numeric series become NaN in a `float64` array; other
+    /// series with nulls, and strings, become `object` arrays.
+    pub fn to_numpy<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let numpy = py.import("numpy")?;
+        let from_bytes = |bytes: &[u8], dtype: &str| {
+            numpy.call_method1("frombuffer", (PyByteArray::new(py, bytes), dtype))
+        };
+        let dense = |bitmap: &[bool]| bitmap.iter().all(|&valid| valid);
+        match &self.inner {
+            Series::F64(_, values, bitmap) if dense(bitmap) => {
+                from_bytes(as_bytes(values), "float64")
+            }
+            Series::I32(_, values, bitmap) if dense(bitmap) => {
+                from_bytes(as_bytes(values), "int32")
+            }
+            Series::Bool(_, values, bitmap) if dense(bitmap) => {
+                from_bytes(as_bytes(values), "bool")
+            }
+            Series::DateTime(_, values, bitmap) if dense(bitmap) => {
+                from_bytes(as_bytes(values), "int64")
+            }
+            Series::F64(_, values, bitmap) => {
+                let masked: Vec<f64> = values
+                    .iter()
+                    .zip(bitmap)
+                    .map(|(&v, &valid)| if valid { v } else { f64::NAN })
+                    .collect();
+                from_bytes(as_bytes(&masked), "float64")
+            }
+            Series::I32(_, values, bitmap) => {
+                let masked: Vec<f64> = values
+                    .iter()
+                    .zip(bitmap)
+                    .map(|(&v, &valid)| if valid { v as f64 } else { f64::NAN })
+                    .collect();
+                from_bytes(as_bytes(&masked), "float64")
+            }
+            _ => numpy.call_method1("array", (self.to_list(py), "object")),
+        }
+    }
+
     /// Calculate correlation with another series
     pub fn correlation(&self, other: &PySeries) -> PyResult<f64> {
         match self.inner.correlation(&other.inner) {
@@ -952,12 +1038,245 @@ impl PySeries {
     }
 }
 
+/// Pair values with their validity as `Option`s
+#[cfg(feature = "python")]
+fn with_nulls<T: Copy>(values: &[T], bitmap: &[bool]) -> Vec<Option<T>> {
+    values
+        .iter()
+        .zip(bitmap)
+        .map(|(&v, &valid)| if valid { Some(v) } else { None })
+        .collect()
+}
+
+/// View a slice of plain numeric values as its native-endian bytes
+#[cfg(feature = "python")]
+fn as_bytes<T: Copy>(values: &[T]) -> &[u8] {
+    unsafe {
+        std::slice::from_raw_parts(values.as_ptr() as *const u8, std::mem::size_of_val(values))
+    }
+}
+
+#[cfg(feature = "python")]
+impl PySeries {
+    /// Infer a series from a buffer or a Python sequence (see `PySeries::new`)
+    fn series_from_data(name: String, data: &Bound<'_, PyAny>) -> PyResult<Series> {
+        if let Some(series) = Self::series_from_buffer(&name, data)? {
+            return Ok(series);
+        }
+        if let Some(values) = Self::small_ints_from_sequence(data)? {
+            return Ok(Series::new_i32(&name, values));
+        }
+        let data: Vec<Option<PyObject>> = data.extract()?;
+        Python::with_gil(|py| {
+            if data.is_empty() {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                    "Cannot create Series from empty data",
+                ));
+            }
+
+            // Infer type from first non-null value
+            let first_valid = data.iter().find(|x| x.is_some()).and_then(|x| x.as_ref());
+
+            let series = match first_valid {
+                Some(obj) if obj.extract::<i32>(py).is_ok() => {
+                    let values: Vec<Option<i32>> = data
+                        .into_iter()
+                        .map(|x| x.and_then(|obj| obj.extract::<i32>(py).ok()))
+                        .collect();
+                    Series::new_i32(&name, values)
+                }
+                Some(obj) if obj.extract::<f64>(py).is_ok() => {
+                    let values: Vec<Option<f64>> = data
+                        .into_iter()
+                        .map(|x| x.and_then(|obj| obj.extract::<f64>(py).ok()))
+                        .collect();
+                    Series::new_f64(&name, values)
+                }
+                Some(obj) if obj.extract::<String>(py).is_ok() => {
+                    let values: Vec<Option<String>> = data
+                        .into_iter()
+                        .map(|x| x.and_then(|obj| obj.extract::<String>(py).ok()))
+                        .collect();
+                    Series::new_string(&name, values)
+                }
+                Some(obj) if obj.extract::<bool>(py).is_ok() => {
+                    let values: Vec<Option<bool>> = data
+                        .into_iter()
+                        .map(|x| x.and_then(|obj| obj.extract::<bool>(py).ok()))
+                        .collect();
+                    Series::new_bool(&name, values)
+                }
+                _ => {
+                    return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                        "Unsupported data type or all values are None",
+                    ));
+                }
+            };
+
+            Ok(series)
+        })
+    }
+
+    /// Fast path for a list or tuple holding only exact `int`s that fit in i32,
+    /// and `None`s. Items are read through the borrowed `PySequence_Fast` item
+    /// array, so no per-element reference, conversion error or intermediate
+    /// `PyObject` vector is created. Returns `Ok(None)` (leaving the generic
+    /// extraction to decide) as soon as any other item is seen, including
+    /// `bool`s, floats and out-of-range ints.
+    fn small_ints_from_sequence(data: &Bound<'_, PyAny>) -> PyResult<Option<Vec<Option<i32>>>> {
+        use pyo3::ffi;
+
+        let obj = data.as_ptr();
+        if unsafe { ffi::PyList_Check(obj) == 0 && ffi::PyTuple_Check(obj) == 0 } {
+            return Ok(None);
+        }
+        // For a list or tuple this is a new reference to the object itself
+        let fast = unsafe {
+            Bound::from_owned_ptr_or_err(data.py(), ffi::PySequence_Fast(obj, c"".as_ptr()))?
+        };
+        let len = unsafe { ffi::PySequence_Fast_GET_SIZE(fast.as_ptr()) } as usize;
+        let items = unsafe { ffi::PySequence_Fast_ITEMS(fast.as_ptr()) };
+
+        let mut values = Vec::with_capacity(len);
+        let mut any_valid = false;
+        for i in 0..len {
+            // Borrowed from the sequence, which `fast` keeps alive; nothing in
+            // this loop runs Python code that could resize it
+            let item = unsafe { *items.add(i) };
+            if item == unsafe { ffi::Py_None() } {
+                values.push(None);
+                continue;
+            }
+            if unsafe { ffi::PyLong_CheckExact(item) } == 0 {
+                return Ok(None);
+            }
+            let mut overflow = 0;
+            let value = unsafe { ffi::PyLong_AsLongAndOverflow(item, &mut overflow) };
+            match i32::try_from(value) {
+                Ok(value) if overflow == 0 => {
+                    values.push(Some(value));
+                    any_valid = true;
+                }
+                _ => return Ok(None),
+            }
+        }
+        Ok(any_valid.then_some(values))
+    }
+
+    /// Narrow the null mask with packed bits or a sequence of bools
+    fn apply_validity(series: Series, validity: &Bound<'_, PyAny>) -> PyResult<Series> {
+        let result = if let Ok(buf) = PyBuffer::<u8>::get(validity) {
+            series.with_validity_bits(&buf.to_vec(validity.py())?)
+        } else {
+            let mask: Vec<bool> = validity.extract()?;
+            series.with_validity(&mask)
+        };
+        match result {
+            Ok(series) => Ok(series),
+            Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                e.to_string(),
+            )),
+        }
+    }
+
+    /// Build a series straight from a buffer-protocol object, if it has a supported
+    /// element type. Returns `Ok(None)` when `data` is not such a buffer.
+    fn series_from_buffer(name: &str, data: &Bound<'_, PyAny>) -> PyResult<Option<Series>> {
+        // Cheap pre-check so plain lists don't pay for four failed buffer requests
+        if unsafe { pyo3::ffi::PyObject_CheckBuffer(data.as_ptr()) } == 0 {
+            return Ok(None);
+        }
+        let py = data.py();
+        let series = if let Ok(buf) = PyBuffer::<f64>::get(data) {
+            let values = buf.to_vec(py)?;
+            let bitmap = vec![true; values.len()];
+            Series::F64(name.to_string(), values, bitmap)
+        } else if let Ok(buf) = PyBuffer::<i32>::get(data) {
+            let values = buf.to_vec(py)?;
+            let bitmap = vec![true; values.len()];
+            Series::I32(name.to_string(), values, bitmap)
+        } else if let Ok(buf) = PyBuffer::<i64>::get(data) {
+            let wide = buf.to_vec(py)?;
+            let bitmap = vec![true; wide.len()];
+            // Same inference as the element-wise path: I32 when every value fits, else F64
+            match wide
+                .iter()
+                .map(|&v| i32::try_from(v))
+                .collect::<Result<Vec<i32>, _>>()
+            {
+                Ok(values) => Series::I32(name.to_string(), values, bitmap),
+                Err(_) => Series::F64(
+                    name.to_string(),
+                    wide.iter().map(|&v| v as f64).collect(),
+                    bitmap,
+                ),
+            }
+        } else if let Ok(buf) = PyBuffer::<bool>::get(data) {
+            let values = buf.to_vec(py)?;
+            let bitmap = vec![true; values.len()];
+            Series::Bool(name.to_string(), values, bitmap)
+        } else {
+            return Ok(None);
+        };
+
+        if series.is_empty() {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Cannot create Series from empty data",
+            ));
+        }
+        Ok(Some(series))
+    }
+}
+
 /// Python wrapper for DataFrame operations
 #[cfg(feature = "python")]
 #[pyclass]
 #[derive(Clone)]
 pub struct PyDataFrame {
     pub(crate) inner: DataFrame,
+    /// Paired moments already computed for `correlation`/`covariance`
+    moments: MomentsCache,
+}
+
+/// Pair moments keyed on (column, column). A PyDataFrame never mutates its
+/// frame (every operation returns a new one, with an empty cache), so entries
+/// stay valid for the object's lifetime and clones may share them.
+#[cfg(feature = "python")]
+type MomentsCache = Arc<Mutex<HashMap<(String, String), PairedMoments>>>;
+
+#[cfg(feature = "python")]
+impl From<DataFrame> for PyDataFrame {
+    fn from(inner: DataFrame) -> Self {
+        PyDataFrame {
+            inner,
+            moments: MomentsCache::default(),
+        }
+    }
+}
+
+#[cfg(feature = "python")]
+impl PyDataFrame {
+    /// Moments for a column pair, computed on first use. Both statistics are
+    /// symmetric, so the pair is stored in name order.
+    fn pair_moments(&self, col1: &str, col2: &str, operation: &str) -> PyResult<PairedMoments> {
+        let key = if col1 <= col2 {
+            (col1.to_string(), col2.to_string())
+        } else {
+            (col2.to_string(), col1.to_string())
+        };
+        if let Some(moments) = self.moments.lock().unwrap().get(&key) {
+            return Ok(*moments);
+        }
+        match self.inner.pair_moments(col1, col2, operation) {
+            Ok(moments) => {
+                self.moments.lock().unwrap().insert(key, moments);
+                Ok(moments)
+            }
+            Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                e.to_string(),
+            )),
+        }
+    }
 }
 
 #[cfg(feature = "python")]
@@ -974,7 +1293,7 @@ impl PyDataFrame {
         }
 
         match DataFrame::new(df_columns) {
-            Ok(df) => Ok(PyDataFrame { inner: df }),
+            Ok(df) => Ok(PyDataFrame::from(df)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1004,7 +1323,7 @@ impl PyDataFrame {
         }
 
         match DataFrame::new(columns) {
-            Ok(df) => Ok(PyDataFrame { inner: df }),
+            Ok(df) => Ok(PyDataFrame::from(df)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1053,7 +1372,7 @@ impl PyDataFrame {
             };
 
             match self.inner.filter(&condition) {
-                Ok(filtered) => Ok(PyDataFrame { inner: filtered }),
+                Ok(filtered) => Ok(PyDataFrame::from(filtered)),
                 Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                     e.to_string(),
                 )),
@@ -1079,7 +1398,7 @@ impl PyDataFrame {
     /// Select columns
     pub fn select(&self, columns: Vec<String>) -> PyResult<Self> {
         match self.inner.select_columns(columns) {
-            Ok(selected) => Ok(PyDataFrame { inner: selected }),
+            Ok(selected) => Ok(PyDataFrame::from(selected)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1094,7 +1413,7 @@ impl PyDataFrame {
     /// Drop columns
     pub fn drop_columns(&self, columns: Vec<String>) -> PyResult<Self> {
         match self.inner.drop_columns(columns) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1104,7 +1423,7 @@ impl PyDataFrame {
     /// Rename a column
     pub fn rename_column(&self, old_name: &str, new_name: &str) -> PyResult<Self> {
         match self.inner.rename_column(old_name, new_name) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1114,7 +1433,7 @@ impl PyDataFrame {
     /// Drop null values
     pub fn drop_nulls(&self, subset: Option<Vec<String>>) -> PyResult<Self> {
         match self.inner.drop_nulls(subset.as_deref()) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1139,7 +1458,7 @@ impl PyDataFrame {
             };
 
             match self.inner.fill_nulls(fill_value) {
-                Ok(result) => Ok(PyDataFrame { inner: result }),
+                Ok(result) => Ok(PyDataFrame::from(result)),
                 Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                     e.to_string(),
                 )),
@@ -1150,7 +1469,7 @@ impl PyDataFrame {
     /// Sort by columns
     pub fn sort(&self, by_columns: Vec<String>, ascending: bool) -> PyResult<Self> {
         match self.inner.sort(by_columns, ascending) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1158,9 +1477,9 @@ impl PyDataFrame {
     }
 
     /// Append another DataFrame
-    pub fn append(&self, other: &PyDataFrame) -> PyResult<Self> {
-        match self.inner.append(&other.inner) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+    pub fn append(&self, py: Python<'_>, other: &PyDataFrame) -> PyResult<Self> {
+        match py.allow_threads(|| self.inner.append(&other.inner)) {
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1169,7 +1488,8 @@ impl PyDataFrame {
 
     /// Calculate correlation between two columns
     pub fn correlation(&self, col1: &str, col2: &str) -> PyResult<f64> {
-        match self.inner.correlation(col1, col2) {
+        let moments = self.pair_moments(col1, col2, "correlation")?;
+        match DataFrame::correlation_from_moments(&moments) {
             Ok(result) => Ok(result),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
@@ -1179,7 +1499,8 @@ impl PyDataFrame {
 
     /// Calculate covariance between two columns
     pub fn covariance(&self, col1: &str, col2: &str) -> PyResult<f64> {
-        match self.inner.covariance(col1, col2) {
+        let moments = self.pair_moments(col1, col2, "covariance")?;
+        match DataFrame::covariance_from_moments(&moments) {
             Ok(result) => Ok(result),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
@@ -1190,7 +1511,7 @@ impl PyDataFrame {
     /// Describe the DataFrame (statistical summary)
     pub fn describe(&self) -> PyResult<Self> {
         match self.inner.describe() {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1203,7 +1524,7 @@ impl PyDataFrame {
             // Try to extract as PyCondition first
             if let Ok(condition) = filter_param.extract::<PyCondition>(py) {
                 match self.inner.filter(&condition.inner) {
-                    Ok(result) => Ok(PyDataFrame { inner: result }),
+                    Ok(result) => Ok(PyDataFrame::from(result)),
                     Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                         e.to_string(),
                     )),
@@ -1211,7 +1532,7 @@ impl PyDataFrame {
             }
             // Try to extract as Vec<usize> for indices
             else if let Ok(indices) = filter_param.extract::<Vec<usize>>(py) {
-                self.filter_by_indices(indices)
+                self.filter_by_indices(py, indices)
             } else {
                 Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
                     "Filter parameter must be either a PyCondition or a list of indices",
@@ -1221,28 +1542,11 @@ impl PyDataFrame {
     }
 
     /// Filter by row indices
-    pub fn filter_by_indices(&self, indices: Vec<usize>) -> PyResult<Self> {
-        // Create a new DataFrame with only the specified rows
-        let mut new_series = std::collections::HashMap::new();
-        let column_names = self.inner.column_names();
-
-        for column_name in column_names {
-            if let Some(series) = self.inner.get_column(column_name) {
-                match series.filter(&indices) {
-                    Ok(filtered_series) => {
-                        new_series.insert(column_name.clone(), filtered_series);
-                    }
-                    Err(e) => {
-                        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                            e.to_string(),
-                        ))
-                    }
-                }
-            }
-        }
-
-        match DataFrame::new(new_series) {
-            Ok(df) => Ok(PyDataFrame { inner: df }),
+    ///
+    /// Columns are gathered in parallel with the GIL released.
+    pub fn filter_by_indices(&self, py: Python<'_>, indices: Vec<usize>) -> PyResult<Self> {
+        match py.allow_threads(|| self.inner.gather_rows(&indices)) {
+            Ok(df) => Ok(PyDataFrame::from(df)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1252,7 +1556,7 @@ impl PyDataFrame {
     /// Add a computed column
     pub fn with_column(&self, name: &str, expr: &PyExpr) -> PyResult<Self> {
         match self.inner.with_column(name, &expr.inner) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1271,7 +1575,7 @@ impl PyDataFrame {
     #[staticmethod]
     pub fn from_json(path: &str) -> PyResult<Self> {
         match DataFrame::from_json(path) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string())),
         }
     }
@@ -1280,7 +1584,24 @@ impl PyDataFrame {
     #[staticmethod]
     pub fn from_csv(path: &str) -> PyResult<Self> {
         match DataFrame::from_csv(path) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
+            Err(e) => Err(PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string())),
+        }
+    }
+
+    /// Load from an Arrow IPC file (memory-mapped, no text parsing)
+    #[staticmethod]
+    pub fn from_ipc(path: &str) -> PyResult<Self> {
+        match DataFrame::from_ipc(path) {
+            Ok(result) => Ok(PyDataFrame::from(result)),
+            Err(e) => Err(PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string())),
+        }
+    }
+
+    /// Export to an Arrow IPC file
+    pub fn to_ipc(&self, path: &str) -> PyResult<()> {
+        match self.inner.to_ipc(path) {
+            Ok(_) => Ok(()),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string())),
         }
     }
@@ -1306,7 +1627,7 @@ impl PyDataFrame {
         };
 
         match self.inner.join(&other.inner, on_column, jt) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1321,7 +1642,7 @@ impl PyDataFrame {
         right_on: &str,
     ) -> PyResult<Self> {
         match UltraFastJoin::inner_join_i32(&self.inner, &other.inner, left_on, right_on) {
-            Ok(result) => Ok(PyDataFrame { inner: result }),
+            Ok(result) => Ok(PyDataFrame::from(result)),
             Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 e.to_string(),
             )),
@@ -1351,6 +1672,108 @@ pub fn simd_sum_f64(data: Vec<f64>) -> f64 {
     data.optimized_simd_sum()
 }
 
+/// Python wrapper for global f64 reductions
+#[cfg(feature = "python")]
+#[pyclass(name = "GlobalAggregate")]
+pub struct PyGlobalAggregate;
+
+#[cfg(feature = "python")]
+impl PyGlobalAggregate {
+    /// Run `f` over the values of a float64 buffer or a sequence of floats with
+    /// the GIL released. Buffers are copied out first: other Python threads may
+    /// write to the exporter's memory as soon as the GIL is released.
+    fn with_values<R: Send>(
+        data: &Bound<'_, PyAny>,
+        f: impl FnOnce(&[f64]) -> R + Send,
+    ) -> PyResult<R> {
+        let py = data.py();
+        if let Ok(buf) = PyBuffer::<f64>::get(data) {
+            let values = buf.to_vec(py)?;
+            return Ok(py.allow_threads(|| f(&values)));
+        }
+        let values: Vec<f64> = data.extract()?;
+        Ok(py.allow_threads(|| f(&values)))
+    }
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl PyGlobalAggregate {
+    /// Sum of a float64 buffer or sequence of floats
+    #[staticmethod]
+    pub fn sum_f64(data: &Bound<'_, PyAny>) -> PyResult<f64> {
+        Self::with_values(data, crate::GlobalAggregate::sum_f64)
+    }
+
+    /// Mean of a float64 buffer or sequence of floats
+    #[staticmethod]
+    pub fn mean_f64(data: &Bound<'_, PyAny>) -> PyResult<f64> {
+        match Self::with_values(data, crate::GlobalAggregate::mean_f64)? {
+            Ok(mean) => Ok(mean),
+            Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                e.to_string(),
+            )),
+        }
+    }
+}
+
+/// Python wrapper for in-place global sorting
+#[cfg(feature = "python")]
+#[pyclass(name = "GlobalSort")]
+pub struct PyGlobalSort;
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl PyGlobalSort {
+    /// Sort a list of floats or a writable contiguous float64 buffer in place
+    #[staticmethod]
+    pub fn sort_f64(data: &Bound<'_, PyAny>) -> PyResult<()> {
+        let py = data.py();
+        if let Ok(buf) = PyBuffer::<f64>::get(data) {
+            if buf.readonly() || !buf.is_c_contiguous() {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                    "sort_f64 requires a writable, C-contiguous float64 buffer",
+                ));
+            }
+            // Other Python threads may touch the exporter's memory whenever the
+            // GIL is released, so sort a private copy and write it back under the GIL
+            let mut values = buf.to_vec(py)?;
+            py.allow_threads(|| crate::GlobalSort::sort_f64(&mut values))
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+            return buf.copy_from_slice(py, &values);
+        }
+
+        let list = data.downcast::<PyList>()?;
+        let mut values: Vec<f64> = list.extract()?;
+        py.allow_threads(|| crate::GlobalSort::sort_f64(&mut values))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        for (i, value) in values.into_iter().enumerate() {
+            list.set_item(i, value)?;
+        }
+        Ok(())
+    }
+}
+
+/// Python wrapper for principal component analysis
+#[cfg(feature = "python")]
+#[pyclass(name = "PCA")]
+pub struct PyPCA;
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl PyPCA {
+    /// First principal component of a matrix given as a list of rows
+    #[staticmethod]
+    pub fn first_component(py: Python<'_>, matrix: Vec<Vec<f64>>) -> PyResult<Vec<f64>> {
+        match py.allow_threads(|| crate::PCA::first_component(&matrix)) {
+            Ok(component) => Ok(component),
+            Err(e) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                e.to_string(),
+            )),
+        }
+    }
+}
+
 /// Create a DataFrame from CSV with high-performance parsing
 #[cfg(feature = "python")]
 #[pyfunction]
@@ -1359,7 +1782,7 @@ pub fn read_csv(file_path: String) -> PyResult<PyDataFrame> {
 
     let reader = CsvReader::new();
     match reader.read_file(&file_path) {
-        Ok(df) => Ok(PyDataFrame { inner: df }),
+        Ok(df) => Ok(PyDataFrame::from(df)),
         Err(e) => Err(PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string())),
     }
 }
@@ -1379,6 +1802,9 @@ fn veloxx(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyCondition>()?;
     m.add_class::<PyExpr>()?;
     m.add_class::<PyValue>()?;
+    m.add_class::<PyGlobalAggregate>()?;
+    m.add_class::<PyGlobalSort>()?;
+    m.add_class::<PyPCA>()?;
 
     // High-performance functions
     m.add_function(wrap_pyfunction!(simd_add_f64, m)?)?;
@@ -244,12 +244,15 @@ impl Series {
                         "No valid values in series".to_string(),
                     ));
                 }
-                valid_values.sort_unstable();
+                // Select the upper middle in O(n); for even lengths the lower
+                // middle is the largest value of the left partition
                 let len = valid_values.len();
+                let (left, &mut upper, _) = valid_values.select_nth_unstable(len / 2);
                 let median = if len % 2 == 0 {
-                    (valid_values[len / 2 - 1] + valid_values[len / 2]) as f64 / 2.0
+                    let lower = left.iter().copied().max().unwrap_or(upper);
+                    (lower as f64 + upper as f64) / 2.0
                 } else {
-                    valid_values[len / 2] as f64
+                    upper as f64
                 };
                 Ok(Value::F64(median))
             }
@@ -264,12 +267,14 @@ impl Series {
                         "No valid values in series".to_string(),
                     ));
                 }
-                valid_values.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
                 let len = valid_values.len();
+                let (left, &mut upper, _) =
+                    valid_values.select_nth_unstable_by(len / 2, f64::total_cmp);
                 let median = if len % 2 == 0 {
-                    (valid_values[len / 2 - 1] + valid_values[len / 2]) / 2.0
+                    let lower = left.iter().copied().max_by(f64::total_cmp).unwrap_or(upper);
+                    (lower + upper) / 2.0
                 } else {
-                    valid_values[len / 2]
+                    upper
                 };
                 Ok(Value::F64(median))
             }
@@ -1,3 +1,4 @@
+use crate::series::validity::Validity;
 use crate::series::Series;
 use crate::types::Value;
 use crate::VeloxxError;
@@ -5,92 +6,40 @@ use crate::VeloxxError;
 impl Series {
     /// Filter the series to only include values at the specified indices
     pub fn filter(&self, indices: &[usize]) -> Result<Series, VeloxxError> {
+        // Bounds are checked once up front so each gather is a plain indexed copy
+        if indices.iter().any(|&idx| idx >= self.len()) {
+            return Err(VeloxxError::InvalidOperation(
+                "Index out of bounds".to_string(),
+            ));
+        }
+        let bitmap =
+            |validity: &[bool]| -> Vec<bool> { indices.iter().map(|&idx| validity[idx]).collect() };
         match self {
-            Series::I32(name, values, bitmap) => {
-                let mut new_values = Vec::with_capacity(indices.len());
-                let mut new_bitmap = Vec::with_capacity(indices.len());
-
-                for &idx in indices {
-                    if idx < values.len() {
-                        new_values.push(values[idx]);
-                        new_bitmap.push(bitmap[idx]);
-                    } else {
-                        return Err(VeloxxError::InvalidOperation(
-                            "Index out of bounds".to_string(),
-                        ));
-                    }
-                }
-
-                Ok(Series::I32(name.clone(), new_values, new_bitmap))
-            }
-            Series::F64(name, values, bitmap) => {
-                let mut new_values = Vec::with_capacity(indices.len());
-                let mut new_bitmap = Vec::with_capacity(indices.len());
-
-                for &idx in indices {
-                    if idx < values.len() {
-                        new_values.push(values[idx]);
-                        new_bitmap.push(bitmap[idx]);
-                    } else {
-                        return Err(VeloxxError::InvalidOperation(
-                            "Index out of bounds".to_string(),
-                        ));
-                    }
-                }
-
-                Ok(Series::F64(name.clone(), new_values, new_bitmap))
-            }
-            Series::Bool(name, values, bitmap) => {
-                let mut new_values = Vec::with_capacity(indices.len());
-                let mut new_bitmap = Vec::with_capacity(indices.len());
-
-                for &idx in indices {
-                    if idx < values.len() {
-                        new_values.push(values[idx]);
-                        new_bitmap.push(bitmap[idx]);
-                    } else {
-                        return Err(VeloxxError::InvalidOperation(
-                            "Index out of bounds".to_string(),
-                        ));
-                    }
-                }
-
-                Ok(Series::Bool(name.clone(), new_values, new_bitmap))
-            }
-            Series::String(name, values, bitmap) => {
-                let mut new_values = Vec::with_capacity(indices.len());
-                let mut new_bitmap = Vec::with_capacity(indices.len());
-
-                for &idx in indices {
-                    if idx < values.len() {
-                        new_values.push(values[idx].clone());
-                        new_bitmap.push(bitmap[idx]);
-                    } else {
-                        return Err(VeloxxError::InvalidOperation(
-                            "Index out of bounds".to_string(),
-                        ));
-                    }
-                }
-
-                Ok(Series::String(name.clone(), new_values, new_bitmap))
-            }
-            Series::DateTime(name, values, bitmap) => {
-                let mut new_values = Vec::with_capacity(indices.len());
-                let mut new_bitmap = Vec::with_capacity(indices.len());
-
-                for &idx in indices {
-                    if idx < values.len() {
-                        new_values.push(values[idx]);
-                        new_bitmap.push(bitmap[idx]);
-                    } else {
-                        return Err(VeloxxError::InvalidOperation(
-                            "Index out of bounds".to_string(),
-                        ));
-                    }
-                }
-
-                Ok(Series::DateTime(name.clone(), new_values, new_bitmap))
-            }
+            Series::I32(name, values, validity) => Ok(Series::I32(
+                name.clone(),
+                indices.iter().map(|&idx| values[idx]).collect(),
+                bitmap(validity),
+            )),
+            Series::F64(name, values, validity) => Ok(Series::F64(
+                name.clone(),
+                indices.iter().map(|&idx| values[idx]).collect(),
+                bitmap(validity),
+            )),
+            Series::Bool(name, values, validity) => Ok(Series::Bool(
+                name.clone(),
+                indices.iter().map(|&idx| values[idx]).collect(),
+                bitmap(validity),
+            )),
+            Series::String(name, values, validity) => Ok(Series::String(
+                name.clone(),
+                indices.iter().map(|&idx| values[idx].clone()).collect(),
+                bitmap(validity),
+            )),
+            Series::DateTime(name, values, validity) => Ok(Series::DateTime(
+                name.clone(),
+                indices.iter().map(|&idx| values[idx]).collect(),
+                bitmap(validity),
+            )),
         }
     }
 
@@ -135,6 +84,81 @@ impl Series {
         }
     }
 
+    /// The null mask packed one bit per value; `Validity::AllValid` if the
+    /// series has no nulls
+    pub fn validity(&self) -> Validity {
+        Validity::from_bools(self.bitmap())
+    }
+
+    /// Number of null values in the series
+    pub fn null_count(&self) -> usize {
+        self.validity().null_count()
+    }
+
+    /// Pack the validity bitmap into bytes, one bit per value, least significant
+    /// bit first (Arrow's layout, and `numpy.packbits(..., bitorder="little")`)
+    pub fn validity_bits(&self) -> Vec<u8> {
+        self.validity().to_bytes()
+    }
+
+    /// Mask the series with packed validity bits in the layout produced by
+    /// [`Series::validity_bits`]. A slot stays valid only if it already was and
+    /// its bit is set, so null placeholders never become values.
+    ///
+    /// `bits` must hold exactly `ceil(len / 8)` bytes; anything else (such as
+    /// an unpacked one-byte-per-value mask) is rejected rather than misread.
+    pub fn with_validity_bits(self, bits: &[u8]) -> Result<Series, VeloxxError> {
+        let validity = Validity::from_packed_bytes(bits, self.len())?;
+        self.with_packed_validity(&validity)
+    }
+
+    /// Mask the series with one bool per value; like
+    /// [`Series::with_validity_bits`], already-null slots stay null.
+    pub fn with_validity(self, mask: &[bool]) -> Result<Series, VeloxxError> {
+        if mask.len() != self.len() {
+            return Err(VeloxxError::InvalidOperation(format!(
+                "Validity mask has {} entries, expected {}",
+                mask.len(),
+                self.len()
+            )));
+        }
+        self.with_packed_validity(&Validity::from_bools(mask))
+    }
+
+    /// Mask the series with a packed [`Validity`] of the same length; an
+    /// `AllValid` mask returns the series untouched.
+    pub fn with_packed_validity(mut self, validity: &Validity) -> Result<Series, VeloxxError> {
+        if validity.len() != self.len() {
+            return Err(VeloxxError::InvalidOperation(format!(
+                "Validity mask has {} entries, expected {}",
+                validity.len(),
+                self.len()
+            )));
+        }
+        validity.narrow(self.bitmap_mut());
+        Ok(self)
+    }
+
+    fn bitmap(&self) -> &[bool] {
+        match self {
+            Series::I32(_, _, bitmap) => bitmap,
+            Series::F64(_, _, bitmap) => bitmap,
+            Series::Bool(_, _, bitmap) => bitmap,
+            Series::String(_, _, bitmap) => bitmap,
+            Series::DateTime(_, _, bitmap) => bitmap,
+        }
+    }
+
+    fn bitmap_mut(&mut self) -> &mut Vec<bool> {
+        match self {
+            Series::I32(_, _, bitmap) => bitmap,
+            Series::F64(_, _, bitmap) => bitmap,
+            Series::Bool(_, _, bitmap) => bitmap,
+            Series::String(_, _, bitmap) => bitmap,
+            Series::DateTime(_, _, bitmap) => bitmap,
+        }
+    }
+
     /// Fill null values with a specified value
     pub fn fill_nulls(&self, value: &Value) -> Result<Series, VeloxxError> {
         let name = self.name().to_string();
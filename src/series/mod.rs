@@ -1,13 +1,18 @@
 use crate::types::{DataType, Value};
 use crate::VeloxxError;
+use moments::PairedMoments;
 
 // Arrow imports only when the `arrow` feature is enabled and not targeting WASM
 #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
 use arrow::array::{
-    ArrayRef, BooleanArray, Float64Array, Int32Array, StringArray, TimestampNanosecondArray,
+    Array, ArrayRef, BooleanArray, Float64Array, Int32Array, StringArray, TimestampNanosecondArray,
 };
 #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+use arrow::buffer::{BooleanBuffer, NullBuffer, ScalarBuffer};
+#[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
 use arrow::datatypes::{DataType as ArrowDataType, TimeUnit};
+#[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+use std::sync::Arc;
 
 // SIMD trait imports - only for native targets
 // Note: we use concrete traits in method scopes to minimize compile-time coupling
@@ -146,96 +151,63 @@ impl Series {
             _ => None,
         }
     }
-    /// Compute the percentile for a given value (0.0 to 100.0) using parallel sorting.
+    /// Compute the percentile for a given value (0.0 to 100.0) using selection rather than a full sort.
+    ///
+    /// Values between ranks are linearly interpolated (numpy's default, and the
+    /// definition `DataFrame::describe` uses), so the result is always `F64`.
     pub fn percentile(&self, pct: f64) -> Result<Option<Value>, VeloxxError> {
         if !(0.0..=100.0).contains(&pct) {
             return Err(VeloxxError::InvalidOperation(
                 "Percentile must be between 0.0 and 100.0".to_string(),
             ));
         }
-        let prob = pct / 100.0;
-        match self {
-            Series::I32(_, values, bitmap) => {
-                use rayon::prelude::*;
-                let mut non_null_data: Vec<i32> = values
-                    .par_iter()
-                    .zip(bitmap.par_iter())
-                    .filter_map(|(&v, &b)| if b { Some(v) } else { None })
-                    .collect();
-                if non_null_data.is_empty() {
-                    return Ok(None);
-                }
-                non_null_data.par_sort_unstable();
-                let n = non_null_data.len();
-                let pos = ((n - 1) as f64 * prob).round() as usize;
-                Ok(Some(Value::I32(non_null_data[pos])))
-            }
-            Series::F64(_, values, bitmap) => {
-                use rayon::prelude::*;
-                let mut non_null_data: Vec<f64> = values
-                    .par_iter()
-                    .zip(bitmap.par_iter())
-                    .filter_map(|(&v, &b)| if b { Some(v) } else { None })
-                    .collect();
-                if non_null_data.is_empty() {
-                    return Ok(None);
-                }
-                non_null_data
-                    .par_sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-                let n = non_null_data.len();
-                let pos = ((n - 1) as f64 * prob).round() as usize;
-                Ok(Some(Value::F64(non_null_data[pos])))
-            }
-            _ => Err(VeloxxError::Unsupported(format!(
-                "Percentile operation not supported for {:?} series.",
-                self.data_type()
-            ))),
-        }
+        self.interpolated_quantile(pct / 100.0, "Percentile")
     }
-    /// Compute the quantile for a given probability (0.0 to 1.0) using parallel sorting.
+    /// Compute the quantile for a given probability (0.0 to 1.0) using selection rather than a full sort.
+    ///
+    /// Interpolates linearly between ranks, like [`Series::percentile`].
     pub fn quantile(&self, prob: f64) -> Result<Option<Value>, VeloxxError> {
         if !(0.0..=1.0).contains(&prob) {
             return Err(VeloxxError::InvalidOperation(
                 "Quantile probability must be between 0.0 and 1.0".to_string(),
             ));
         }
-        match self {
+        self.interpolated_quantile(prob, "Quantile")
+    }
+
+    /// Shared body of `percentile`/`quantile`; `operation` names the caller in errors
+    fn interpolated_quantile(
+        &self,
+        prob: f64,
+        operation: &str,
+    ) -> Result<Option<Value>, VeloxxError> {
+        use rayon::prelude::*;
+        let value = match self {
             Series::I32(_, values, bitmap) => {
-                use rayon::prelude::*;
                 let mut non_null_data: Vec<i32> = values
                     .par_iter()
                     .zip(bitmap.par_iter())
                     .filter_map(|(&v, &b)| if b { Some(v) } else { None })
                     .collect();
-                if non_null_data.is_empty() {
-                    return Ok(None);
-                }
-                non_null_data.par_sort_unstable();
-                let n = non_null_data.len();
-                let pos = ((n - 1) as f64 * prob).round() as usize;
-                Ok(Some(Value::I32(non_null_data[pos])))
+                select_quantile(&mut non_null_data, prob, Ord::cmp)
             }
             Series::F64(_, values, bitmap) => {
-                use rayon::prelude::*;
                 let mut non_null_data: Vec<f64> = values
                     .par_iter()
                     .zip(bitmap.par_iter())
                     .filter_map(|(&v, &b)| if b { Some(v) } else { None })
                     .collect();
-                if non_null_data.is_empty() {
-                    return Ok(None);
-                }
-                non_null_data
-                    .par_sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-                let n = non_null_data.len();
-                let pos = ((n - 1) as f64 * prob).round() as usize;
-                Ok(Some(Value::F64(non_null_data[pos])))
+                select_quantile(&mut non_null_data, prob, f64::total_cmp)
             }
-            _ => Err(VeloxxError::Unsupported(format!(
-                "Quantile operation not supported for {:?} series.",
-                self.data_type()
-            ))),
-        }
+            _ => {
+                return Err(VeloxxError::Unsupported(format!(
+                    "{} operation not supported for {:?} series.",
+                    operation,
+                    self.data_type()
+                )))
+            }
+        };
+        Ok(value.map(Value::F64))
     }
     pub fn new_i32(name: &str, data: Vec<Option<i32>>) -> Self {
         let mut values = Vec::with_capacity(data.len());
@@ -335,9 +307,11 @@ impl Series {
                 let arr = array.as_any().downcast_ref::<Int32Array>().ok_or_else(|| {
                     VeloxxError::Parsing("Failed to downcast to Int32Array".to_string())
                 })?;
-                let values: Vec<i32> = arr.iter().flatten().collect();
-                let bitmap: Vec<bool> = arr.iter().map(|x| x.is_some()).collect();
-                Ok(Series::I32(name, values, bitmap))
+                Ok(Series::I32(
+                    name,
+                    arr.values().to_vec(),
+                    Self::arrow_validity(arr),
+                ))
             }
             ArrowDataType::Float64 => {
                 let arr = array
@@ -346,9 +320,11 @@ impl Series {
                     .ok_or_else(|| {
                         VeloxxError::Parsing("Failed to downcast to Float64Array".to_string())
                     })?;
-                let values: Vec<f64> = arr.iter().flatten().collect();
-                let bitmap: Vec<bool> = arr.iter().map(|x| x.is_some()).collect();
-                Ok(Series::F64(name, values, bitmap))
+                Ok(Series::F64(
+                    name,
+                    arr.values().to_vec(),
+                    Self::arrow_validity(arr),
+                ))
             }
             ArrowDataType::Boolean => {
                 let arr = array
@@ -357,9 +333,8 @@ impl Series {
                     .ok_or_else(|| {
                         VeloxxError::Parsing("Failed to downcast to BooleanArray".to_string())
                     })?;
-                let values: Vec<bool> = arr.iter().flatten().collect();
-                let bitmap: Vec<bool> = arr.iter().map(|x| x.is_some()).collect();
-                Ok(Series::Bool(name, values, bitmap))
+                let values: Vec<bool> = arr.iter().map(|x| x.unwrap_or(false)).collect();
+                Ok(Series::Bool(name, values, Self::arrow_validity(arr)))
             }
             ArrowDataType::Utf8 => {
                 let arr = array
@@ -368,9 +343,11 @@ impl Series {
                     .ok_or_else(|| {
                         VeloxxError::Parsing("Failed to downcast to StringArray".to_string())
                     })?;
-                let values: Vec<String> = arr.iter().flatten().map(|s| s.to_string()).collect();
-                let bitmap: Vec<bool> = arr.iter().map(|x| x.is_some()).collect();
-                Ok(Series::String(name, values, bitmap))
+                let values: Vec<String> = arr
+                    .iter()
+                    .map(|x| x.unwrap_or_default().to_string())
+                    .collect();
+                Ok(Series::String(name, values, Self::arrow_validity(arr)))
             }
             ArrowDataType::Timestamp(TimeUnit::Nanosecond, _) => {
                 let arr = array
@@ -381,9 +358,11 @@ impl Series {
                             "Failed to downcast to TimestampNanosecondArray".to_string(),
                         )
                     })?;
-                let values: Vec<i64> = arr.iter().flatten().collect();
-                let bitmap: Vec<bool> = arr.iter().map(|x| x.is_some()).collect();
-                Ok(Series::DateTime(name, values, bitmap))
+                Ok(Series::DateTime(
+                    name,
+                    arr.values().to_vec(),
+                    Self::arrow_validity(arr),
+                ))
             }
             _ => Err(VeloxxError::Unsupported(format!(
                 "Unsupported Arrow data type: {:?}",
@@ -392,6 +371,52 @@ impl Series {
         }
     }
 
+    /// Validity bitmap of an Arrow array, one entry per slot
+    #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+    fn arrow_validity(array: &dyn Array) -> Vec<bool> {
+        match array.nulls() {
+            Some(nulls) => nulls.iter().collect(),
+            None => vec![true; array.len()],
+        }
+    }
+
+    /// Convert the Series into an Arrow array (requires `arrow` feature, not available in WASM)
+    #[cfg(all(feature = "arrow", not(target_arch = "wasm32")))]
+    pub fn to_arrow_array(&self) -> ArrayRef {
+        fn nulls(bitmap: &[bool]) -> Option<NullBuffer> {
+            if bitmap.iter().all(|&b| b) {
+                None
+            } else {
+                Some(NullBuffer::from(bitmap.to_vec()))
+            }
+        }
+
+        match self {
+            Series::I32(_, values, bitmap) => Arc::new(Int32Array::new(
+                ScalarBuffer::from(values.clone()),
+                nulls(bitmap),
+            )),
+            Series::F64(_, values, bitmap) => Arc::new(Float64Array::new(
+                ScalarBuffer::from(values.clone()),
+                nulls(bitmap),
+            )),
+            Series::Bool(_, values, bitmap) => Arc::new(BooleanArray::new(
+                BooleanBuffer::from(values.clone()),
+                nulls(bitmap),
+            )),
+            Series::String(_, values, bitmap) => Arc::new(StringArray::from_iter(
+                values
+                    .iter()
+                    .zip(bitmap)
+                    .map(|(v, &valid)| valid.then_some(v.as_str())),
+            )),
+            Series::DateTime(_, values, bitmap) => Arc::new(TimestampNanosecondArray::new(
+                ScalarBuffer::from(values.clone()),
+                nulls(bitmap),
+            )),
+        }
+    }
+
     pub fn concat(series_list: Vec<Series>) -> Result<Self, VeloxxError> {
         if series_list.is_empty() {
             return Err(VeloxxError::InvalidOperation(
@@ -626,43 +651,31 @@ impl Series {
                 other.data_type()
             )));
         }
+        // Each output buffer is allocated once at its final size; for the
+        // primitive columns `extend_from_slice` lowers to a straight memcpy
+        fn concat<T: Clone>(first: &[T], second: &[T]) -> Vec<T> {
+            let mut out = Vec::with_capacity(first.len() + second.len());
+            out.extend_from_slice(first);
+            out.extend_from_slice(second);
+            out
+        }
         let new_name = self.name().to_string();
         match (self, other) {
-            (Series::I32(_, values1, bitmap1), Series::I32(_, values2, bitmap2)) => {
-                let mut new_values = values1.clone();
-                let mut new_bitmap = bitmap1.clone();
-                new_values.extend(values2.iter().cloned());
-                new_bitmap.extend(bitmap2.iter().cloned());
-                Ok(Series::I32(new_name, new_values, new_bitmap))
-            }
-            (Series::F64(_, values1, bitmap1), Series::F64(_, values2, bitmap2)) => {
-                let mut new_values = values1.clone();
-                let mut new_bitmap = bitmap1.clone();
-                new_values.extend(values2.iter().cloned());
-                new_bitmap.extend(bitmap2.iter().cloned());
-                Ok(Series::F64(new_name, new_values, new_bitmap))
-            }
-            (Series::Bool(_, values1, bitmap1), Series::Bool(_, values2, bitmap2)) => {
-                let mut new_values = values1.clone();
-                let mut new_bitmap = bitmap1.clone();
-                new_values.extend(values2.iter().cloned());
-                new_bitmap.extend(bitmap2.iter().cloned());
-                Ok(Series::Bool(new_name, new_values, new_bitmap))
-            }
-            (Series::String(_, values1, bitmap1), Series::String(_, values2, bitmap2)) => {
-                let mut new_values = values1.clone();
-                let mut new_bitmap = bitmap1.clone();
-                new_values.extend(values2.iter().cloned());
-                new_bitmap.extend(bitmap2.iter().cloned());
-                Ok(Series::String(new_name, new_values, new_bitmap))
-            }
-            (Series::DateTime(_, values1, bitmap1), Series::DateTime(_, values2, bitmap2)) => {
-                let mut new_values = values1.clone();
-                let mut new_bitmap = bitmap1.clone();
-                new_values.extend(values2.iter().cloned());
-                new_bitmap.extend(bitmap2.iter().cloned());
-                Ok(Series::DateTime(new_name, new_values, new_bitmap))
-            }
+            (Series::I32(_, values1, bitmap1), Series::I32(_, values2, bitmap2)) => Ok(
+                Series::I32(new_name, concat(values1, values2), concat(bitmap1, bitmap2)),
+            ),
+            (Series::F64(_, values1, bitmap1), Series::F64(_, values2, bitmap2)) => Ok(
+                Series::F64(new_name, concat(values1, values2), concat(bitmap1, bitmap2)),
+            ),
+            (Series::Bool(_, values1, bitmap1), Series::Bool(_, values2, bitmap2)) => Ok(
+                Series::Bool(new_name, concat(values1, values2), concat(bitmap1, bitmap2)),
+            ),
+            (Series::String(_, values1, bitmap1), Series::String(_, values2, bitmap2)) => Ok(
+                Series::String(new_name, concat(values1, values2), concat(bitmap1, bitmap2)),
+            ),
+            (Series::DateTime(_, values1, bitmap1), Series::DateTime(_, values2, bitmap2)) => Ok(
+                Series::DateTime(new_name, concat(values1, values2), concat(bitmap1, bitmap2)),
+            ),
             _ => Err(VeloxxError::InvalidOperation(
                 "Mismatched series types during append (should be caught by data_type check)."
                     .to_string(),
@@ -798,41 +811,30 @@ impl Series {
             ));
         }
 
-        // Extract numeric values, skipping nulls
-        let mut pairs = Vec::new();
-        for i in 0..self.len() {
-            if let (Some(x), Some(y)) = (self.get_numeric_f64(i), other.get_numeric_f64(i)) {
-                pairs.push((x, y));
+        let moments = match (self, other) {
+            // Dense F64 columns: accumulate straight off the backing buffers
+            (Series::F64(_, x, x_valid), Series::F64(_, y, y_valid))
+                if x_valid.iter().all(|&b| b) && y_valid.iter().all(|&b| b) =>
+            {
+                PairedMoments::from_slices(x, y)
+            }
+            _ => {
+                // Gather the pairwise non-null values into contiguous buffers
+                let mut xs = Vec::with_capacity(self.len());
+                let mut ys = Vec::with_capacity(self.len());
+                for i in 0..self.len() {
+                    if let (Some(x), Some(y)) = (self.get_numeric_f64(i), other.get_numeric_f64(i))
+                    {
+                        xs.push(x);
+                        ys.push(y);
+                    }
+                }
+                PairedMoments::from_slices(&xs, &ys)
             }
-        }
-
-        if pairs.len() < 2 {
-            return Ok(None); // Not enough data points
-        }
-
-        // Calculate means
-        let mean_x: f64 = pairs.iter().map(|(x, _)| x).sum::<f64>() / pairs.len() as f64;
-        let mean_y: f64 = pairs.iter().map(|(_, y)| y).sum::<f64>() / pairs.len() as f64;
-
-        // Calculate correlation
-        let mut numerator = 0.0;
-        let mut sum_x_sq = 0.0;
-        let mut sum_y_sq = 0.0;
-
-        for (x, y) in pairs {
-            let dx = x - mean_x;
-            let dy = y - mean_y;
-            numerator += dx * dy;
-            sum_x_sq += dx * dx;
-            sum_y_sq += dy * dy;
-        }
+        };
 
-        let denominator = (sum_x_sq * sum_y_sq).sqrt();
-        if denominator == 0.0 {
-            Ok(None) // No variance
-        } else {
-            Ok(Some(numerator / denominator))
-        }
+        // None when there are fewer than 2 points or no variance
+        Ok(moments.correlation())
     }
 
     /// Calculate covariance between two numeric series
@@ -882,7 +884,36 @@ impl Series {
     }
 }
 
+/// Linearly interpolated quantile of `data` at `prob` in [0, 1], or None if
+/// empty. Selects the floor rank in O(n); its successor is the minimum of the
+/// right partition, so no full sort is needed.
+fn select_quantile<T>(
+    data: &mut [T],
+    prob: f64,
+    cmp: fn(&T, &T) -> std::cmp::Ordering,
+) -> Option<f64>
+where
+    T: Copy + Into<f64>,
+{
+    if data.is_empty() {
+        return None;
+    }
+    let rank = (data.len() - 1) as f64 * prob;
+    let k = rank.floor() as usize;
+    let fraction = rank - k as f64;
+    let (_, lower, upper_part) = data.select_nth_unstable_by(k, cmp);
+    let lower: f64 = (*lower).into();
+    match upper_part.iter().min_by(|a, b| cmp(a, b)) {
+        Some(&upper) if fraction > 0.0 => Some(lower + (upper.into() - lower) * fraction),
+        _ => Some(lower),
+    }
+}
+
 pub mod aggregations;
 pub mod arithmetic;
+pub(crate) mod moments;
 pub mod ops;
+pub(crate) mod summary;
+pub(crate) mod tdigest;
 pub mod time_series;
+pub mod validity;
@@ -0,0 +1,249 @@
+// Single-pass count/mean/std/min/max used by `DataFrame::describe`.
+//
+// Every statistic is accumulated in one sweep over the values and validity
+// mask. The inner loop is branchless: null slots are replaced by neutral
+// values with selects rather than skipped, and 16 independent lanes keep the
+// min/max and sum chains free of loop-carried dependencies, so the loop lowers
+// to packed min/max/add instructions on any SIMD target. As in `moments`, sums
+// are shifted by the first valid value to keep the sum-of-squares variance
+// accurate for data with a large offset.
+
+use super::tdigest::TDigest;
+use rayon::prelude::*;
+
+/// Lanes per accumulator; four 4-wide vectors on AVX2
+const LANES: usize = 16;
+
+/// Elements per rayon task
+const PARALLEL_BLOCK: usize = 1 << 16;
+
+/// Up to this many valid values quartiles are exact; larger columns are
+/// sketched with a t-digest instead of being copied out and sorted
+const EXACT_QUANTILE_LIMIT: usize = 1 << 16;
+
+/// t-digest compression used for large columns
+const DIGEST_COMPRESSION: f64 = 100.0;
+
+/// 25th, 50th and 75th percentiles of the valid values, linearly interpolated
+/// between ranks (so the 50th is the usual median); None if there are none.
+///
+/// `n_valid` is the valid count from a prior `Summary`. Above
+/// `EXACT_QUANTILE_LIMIT` the result is approximate: each rayon block builds
+/// a t-digest in one pass and the digests are merged.
+pub(crate) fn quartiles<T>(values: &[T], validity: &[bool], n_valid: usize) -> Option<[f64; 3]>
+where
+    T: Copy + Into<f64> + Sync,
+{
+    const PROBS: [f64; 3] = [0.25, 0.5, 0.75];
+    if n_valid == 0 {
+        return None;
+    }
+
+    if n_valid <= EXACT_QUANTILE_LIMIT {
+        let mut sorted: Vec<f64> = values
+            .iter()
+            .zip(validity)
+            .filter(|(_, &valid)| valid)
+            .map(|(&v, _)| v.into())
+            .collect();
+        sorted.sort_unstable_by(f64::total_cmp);
+        let last = (sorted.len() - 1) as f64;
+        return Some(PROBS.map(|q| {
+            let rank = q * last;
+            let (lo, hi) = (rank.floor() as usize, rank.ceil() as usize);
+            sorted[lo] + (sorted[hi] - sorted[lo]) * (rank - lo as f64)
+        }));
+    }
+
+    let mut digest = values
+        .par_chunks(PARALLEL_BLOCK)
+        .zip(validity.par_chunks(PARALLEL_BLOCK))
+        .map(|(v, b)| {
+            let mut digest = TDigest::new(DIGEST_COMPRESSION);
+            for (&v, &valid) in v.iter().zip(b) {
+                if valid {
+                    digest.insert(v.into());
+                }
+            }
+            digest
+        })
+        .reduce(|| TDigest::new(DIGEST_COMPRESSION), TDigest::merge);
+    let [q25, q50, q75] = PROBS.map(|q| digest.quantile(q));
+    Some([q25?, q50?, q75?])
+}
+
+/// Count, shifted sums and extrema over the valid values of a column.
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub(crate) struct Summary {
+    pub n: usize,
+    shift: f64,
+    sum: f64,
+    sum_sq: f64,
+    pub min: f64,
+    pub max: f64,
+}
+
+impl Summary {
+    /// Summarize the valid values of a column; `T` is widened to f64 lane-wise
+    pub fn from_slices<T>(values: &[T], validity: &[bool]) -> Self
+    where
+        T: Copy + Into<f64> + Sync,
+    {
+        debug_assert_eq!(values.len(), validity.len());
+        let shift = values
+            .iter()
+            .zip(validity)
+            .find(|(_, &valid)| valid)
+            .map_or(0.0, |(&v, _)| v.into());
+
+        if values.len() <= PARALLEL_BLOCK {
+            return Self::block(values, validity, shift);
+        }
+        values
+            .par_chunks(PARALLEL_BLOCK)
+            .zip(validity.par_chunks(PARALLEL_BLOCK))
+            .map(|(v, b)| Self::block(v, b, shift))
+            .reduce(|| Self::empty(shift), Self::merge)
+    }
+
+    /// Mean of the valid values, None if there are none
+    pub fn mean(&self) -> Option<f64> {
+        if self.n == 0 {
+            return None;
+        }
+        Some(self.shift + self.sum / self.n as f64)
+    }
+
+    /// Sample standard deviation, None with fewer than two values
+    pub fn std_dev(&self) -> Option<f64> {
+        if self.n < 2 {
+            return None;
+        }
+        let n = self.n as f64;
+        let m2 = (self.sum_sq - self.sum * self.sum / n).max(0.0);
+        Some((m2 / (n - 1.0)).sqrt())
+    }
+
+    fn empty(shift: f64) -> Self {
+        Self {
+            n: 0,
+            shift,
+            sum: 0.0,
+            sum_sq: 0.0,
+            min: f64::INFINITY,
+            max: f64::NEG_INFINITY,
+        }
+    }
+
+    fn merge(a: Self, b: Self) -> Self {
+        Self {
+            n: a.n + b.n,
+            shift: a.shift,
+            sum: a.sum + b.sum,
+            sum_sq: a.sum_sq + b.sum_sq,
+            min: a.min.min(b.min),
+            max: a.max.max(b.max),
+        }
+    }
+
+    /// Branchless lane kernel over one contiguous block
+    fn block<T: Copy + Into<f64>>(values: &[T], validity: &[bool], shift: f64) -> Self {
+        let mut n = [0usize; LANES];
+        let mut sum = [0.0f64; LANES];
+        let mut sum_sq = [0.0f64; LANES];
+        let mut min = [f64::INFINITY; LANES];
+        let mut max = [f64::NEG_INFINITY; LANES];
+
+        let value_chunks = values.chunks_exact(LANES);
+        let valid_chunks = validity.chunks_exact(LANES);
+        let (value_rem, valid_rem) = (value_chunks.remainder(), valid_chunks.remainder());
+        for (cv, cb) in value_chunks.zip(valid_chunks) {
+            for lane in 0..LANES {
+                let valid = cb[lane];
+                let v: f64 = cv[lane].into();
+                // `x < m ? x : m` is exactly minpd/maxpd; NaN never replaces
+                // the running extremum, matching `f64::min`/`f64::max`
+                let lo = if valid { v } else { f64::INFINITY };
+                let hi = if valid { v } else { f64::NEG_INFINITY };
+                min[lane] = if lo < min[lane] { lo } else { min[lane] };
+                max[lane] = if hi > max[lane] { hi } else { max[lane] };
+                let d = if valid { v - shift } else { 0.0 };
+                n[lane] += valid as usize;
+                sum[lane] += d;
+                sum_sq[lane] += d * d;
+            }
+        }
+        for (&v, &valid) in value_rem.iter().zip(valid_rem) {
+            if valid {
+                let v: f64 = v.into();
+                let d = v - shift;
+                n[0] += 1;
+                sum[0] += d;
+                sum_sq[0] += d * d;
+                min[0] = if v < min[0] { v } else { min[0] };
+                max[0] = if v > max[0] { v } else { max[0] };
+            }
+        }
+
+        Self {
+            n: n.iter().sum(),
+            shift,
+            sum: sum.iter().sum(),
+            sum_sq: sum_sq.iter().sum(),
+            min: min.iter().copied().fold(f64::INFINITY, f64::min),
+            max: max.iter().copied().fold(f64::NEG_INFINITY, f64::max),
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_summary_matches_two_pass() {
+        let values: Vec<f64> = (0..53).map(|i| 1.0e6 + ((i * 7) % 13) as f64).collect();
+        let validity: Vec<bool> = (0..53).map(|i| i % 5 != 0).collect();
+        let s = Summary::from_slices(&values, &validity);
+
+        let valid: Vec<f64> = values
+            .iter()
+            .zip(&validity)
+            .filter(|(_, &b)| b)
+            .map(|(&v, _)| v)
+            .collect();
+        let n = valid.len() as f64;
+        let mean = valid.iter().sum::<f64>() / n;
+        let var = valid.iter().map(|v| (v - mean).powi(2)).sum::<f64>() / (n - 1.0);
+
+        assert_eq!(s.n, valid.len());
+        assert!((s.mean().unwrap() - mean).abs() < 1e-9);
+        assert!((s.std_dev().unwrap() - var.sqrt()).abs() < 1e-9);
+        assert_eq!(s.min, valid.iter().copied().fold(f64::INFINITY, f64::min));
+        assert_eq!(
+            s.max,
+            valid.iter().copied().fold(f64::NEG_INFINITY, f64::max)
+        );
+
+        let ints = Summary::from_slices(&[3i32, -8, 5], &[true, true, false]);
+        assert_eq!((ints.min, ints.max, ints.mean()), (-8.0, 3.0, Some(-2.5)));
+        assert_eq!(Summary::from_slices::<i32>(&[1], &[false]).mean(), None);
+    }
+
+    #[test]
+    fn test_quartiles() {
+        let values = [35, 20, 0, 30, 25];
+        let validity = [true, true, false, true, true];
+        assert_eq!(quartiles(&values, &validity, 4), Some([23.75, 27.5, 31.25]));
+        assert_eq!(quartiles::<i32>(&[], &[], 0), None);
+
+        // Large enough for the t-digest path
+        let n = 3 * EXACT_QUANTILE_LIMIT + 11;
+        let values: Vec<f64> = (0..n).map(|i| ((i * 7919) % n) as f64).collect();
+        let [q25, q50, q75] = quartiles(&values, &vec![true; n], n).unwrap();
+        let last = (n - 1) as f64;
+        assert!((q25 - 0.25 * last).abs() < 1e-3 * n as f64);
+        assert!((q50 - 0.5 * last).abs() < 1e-3 * n as f64);
+        assert!((q75 - 0.75 * last).abs() < 1e-3 * n as f64);
+    }
+}
@@ -0,0 +1,185 @@
+// Merging t-digest for approximate quantiles in bounded memory.
+//
+// Values are buffered and periodically merged into a sorted list of weighted
+// centroids using the k1 scale function, which keeps centroids small near
+// the tails and lets them grow toward the median. The digest holds O(compression)
+// centroids regardless of input size, and digests built over separate blocks
+// can be merged, so large columns are summarized in parallel.
+
+use std::f64::consts::PI;
+
+/// Pending values per centroid budget before a merge pass
+const BUFFER_FACTOR: usize = 5;
+
+#[derive(Debug, Clone, Copy)]
+struct Centroid {
+    mean: f64,
+    weight: f64,
+}
+
+/// Streaming quantile sketch.
+#[derive(Debug, Clone)]
+pub(crate) struct TDigest {
+    compression: f64,
+    centroids: Vec<Centroid>,
+    buffer: Vec<f64>,
+    min: f64,
+    max: f64,
+}
+
+impl TDigest {
+    /// An empty digest; larger `compression` keeps more centroids and gives
+    /// tighter quantiles (100 is a common default)
+    pub fn new(compression: f64) -> Self {
+        Self {
+            compression,
+            centroids: Vec::new(),
+            buffer: Vec::with_capacity(BUFFER_FACTOR * compression as usize),
+            min: f64::INFINITY,
+            max: f64::NEG_INFINITY,
+        }
+    }
+
+    /// Add one value; NaN is ignored
+    pub fn insert(&mut self, value: f64) {
+        if value.is_nan() {
+            return;
+        }
+        self.min = self.min.min(value);
+        self.max = self.max.max(value);
+        self.buffer.push(value);
+        if self.buffer.len() >= BUFFER_FACTOR * self.compression as usize {
+            self.compress();
+        }
+    }
+
+    /// Combine two digests built over disjoint data
+    pub fn merge(mut self, mut other: Self) -> Self {
+        self.min = self.min.min(other.min);
+        self.max = self.max.max(other.max);
+        self.buffer.append(&mut other.buffer);
+        self.centroids.append(&mut other.centroids);
+        self.merge_pass();
+        self
+    }
+
+    /// Approximate value at probability `q` in [0, 1], linearly interpolated
+    /// between centroid centers; None if the digest is empty.
+    ///
+    /// While every centroid still holds a single value this is exactly the
+    /// linear-interpolation quantile of the inserted data.
+    pub fn quantile(&mut self, q: f64) -> Option<f64> {
+        self.compress();
+        let total: f64 = self.centroids.iter().map(|c| c.weight).sum();
+        if total == 0.0 {
+            return None;
+        }
+        // Target rank and each centroid's center on the same 0..total-1 scale
+        let rank = q.clamp(0.0, 1.0) * (total - 1.0);
+        let mut previous = (0.0, self.min);
+        let mut cumulative = 0.0;
+        for c in &self.centroids {
+            let center = cumulative + (c.weight - 1.0) / 2.0;
+            if rank <= center {
+                return Some(Self::interpolate(previous, (center, c.mean), rank));
+            }
+            previous = (center, c.mean);
+            cumulative += c.weight;
+        }
+        Some(Self::interpolate(previous, (total - 1.0, self.max), rank))
+    }
+
+    fn interpolate((x0, y0): (f64, f64), (x1, y1): (f64, f64), x: f64) -> f64 {
+        if x1 <= x0 {
+            return y1;
+        }
+        y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+    }
+
+    /// k1 scale: centroid sizes shrink like sqrt(q(1-q)) toward the tails
+    fn scale(&self, q: f64) -> f64 {
+        self.compression / (2.0 * PI) * (2.0 * q.clamp(0.0, 1.0) - 1.0).asin()
+    }
+
+    /// Fold buffered values into the centroid list
+    fn compress(&mut self) {
+        if !self.buffer.is_empty() {
+            self.merge_pass();
+        }
+    }
+
+    /// Sort centroids and buffered values together and re-merge them in one
+    /// pass, letting neighbours combine while the k1 scale allows
+    fn merge_pass(&mut self) {
+        let mut items = std::mem::take(&mut self.centroids);
+        items.extend(
+            self.buffer
+                .drain(..)
+                .map(|mean| Centroid { mean, weight: 1.0 }),
+        );
+        if items.is_empty() {
+            return;
+        }
+        items.sort_unstable_by(|a, b| a.mean.total_cmp(&b.mean));
+
+        let total: f64 = items.iter().map(|c| c.weight).sum();
+        let mut merged = Vec::with_capacity(items.len().min(2 * self.compression as usize));
+        let mut current = items[0];
+        let mut weight_before = 0.0;
+        let mut k_lower = self.scale(0.0);
+        for &item in &items[1..] {
+            let q_upper = (weight_before + current.weight + item.weight) / total;
+            if self.scale(q_upper) - k_lower <= 1.0 {
+                let weight = current.weight + item.weight;
+                current.mean += (item.mean - current.mean) * item.weight / weight;
+                current.weight = weight;
+            } else {
+                weight_before += current.weight;
+                k_lower = self.scale(weight_before / total);
+                merged.push(current);
+                current = item;
+            }
+        }
+        merged.push(current);
+        self.centroids = merged;
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_tdigest_quantiles() {
+        // Few values: every centroid is a singleton, so quantiles are exact
+        let mut small = TDigest::new(100.0);
+        for v in [35.0, 20.0, 30.0, 25.0] {
+            small.insert(v);
+        }
+        assert_eq!(small.quantile(0.5), Some(27.5));
+        assert_eq!(small.quantile(0.25), Some(23.75));
+        assert_eq!(small.quantile(1.0), Some(35.0));
+        assert_eq!(TDigest::new(100.0).quantile(0.5), None);
+
+        // Many values, built as two merged halves
+        let n = 200_000;
+        let (mut a, mut b) = (TDigest::new(100.0), TDigest::new(100.0));
+        for i in 0..n {
+            let v = ((i * 7919) % n) as f64;
+            if i % 2 == 0 {
+                a.insert(v);
+            } else {
+                b.insert(v);
+            }
+        }
+        let mut digest = a.merge(b);
+        assert!(digest.centroids.len() < 200);
+        for q in [0.01, 0.25, 0.5, 0.75, 0.99] {
+            let expected = q * (n - 1) as f64;
+            let error = (digest.quantile(q).unwrap() - expected).abs() / n as f64;
+            assert!(error < 1e-3, "q={q} error={error}");
+        }
+        assert_eq!(digest.quantile(0.0), Some(0.0));
+        assert_eq!(digest.quantile(1.0), Some((n - 1) as f64));
+    }
+}
@@ -0,0 +1,180 @@
+// Packed validity bitmaps.
+//
+// A column's null mask packed one bit per value into u64 words, least
+// significant bit first, as in Arrow. A fully valid mask is stored as
+// `AllValid` with no allocation, so the common no-nulls case costs nothing to
+// build, count or apply, and null counts on packed words are a popcount per
+// 64 values.
+
+use crate::VeloxxError;
+
+/// Null mask of a column, one bit per value.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub enum Validity {
+    /// Every one of `len` values is valid
+    AllValid(usize),
+    /// Packed bits, LSB first; bits at and past `len` are always zero
+    Bits { words: Vec<u64>, len: usize },
+}
+
+impl Validity {
+    /// Pack one bool per value
+    pub fn from_bools(mask: &[bool]) -> Self {
+        if mask.iter().all(|&valid| valid) {
+            return Validity::AllValid(mask.len());
+        }
+        let words = mask
+            .chunks(64)
+            .map(|chunk| {
+                chunk
+                    .iter()
+                    .enumerate()
+                    .fold(0u64, |word, (bit, &valid)| word | ((valid as u64) << bit))
+            })
+            .collect();
+        Validity::Bits {
+            words,
+            len: mask.len(),
+        }
+    }
+
+    /// Read `len` values' bits from bytes in the layout of [`Validity::to_bytes`]
+    /// (and `numpy.packbits(..., bitorder="little")`).
+    ///
+    /// `bytes` must hold exactly `ceil(len / 8)` bytes; anything else (such as
+    /// an unpacked one-byte-per-value mask) is rejected rather than misread.
+    pub fn from_packed_bytes(bytes: &[u8], len: usize) -> Result<Self, VeloxxError> {
+        if bytes.len() != len.div_ceil(8) {
+            return Err(VeloxxError::InvalidOperation(format!(
+                "Validity bitmap has {} bytes, expected {} packed bytes for {} values",
+                bytes.len(),
+                len.div_ceil(8),
+                len
+            )));
+        }
+        let mut words: Vec<u64> = bytes
+            .chunks(8)
+            .map(|chunk| {
+                let mut word = [0u8; 8];
+                word[..chunk.len()].copy_from_slice(chunk);
+                u64::from_le_bytes(word)
+            })
+            .collect();
+        // Padding bits past `len` carry no meaning; clear them so they never
+        // count as valid
+        if let (Some(last), 1..=63) = (words.last_mut(), len % 64) {
+            *last &= (1u64 << (len % 64)) - 1;
+        }
+        if words.iter().map(|w| w.count_ones() as usize).sum::<usize>() == len {
+            return Ok(Validity::AllValid(len));
+        }
+        Ok(Validity::Bits { words, len })
+    }
+
+    /// Number of values covered
+    pub fn len(&self) -> usize {
+        match self {
+            Validity::AllValid(len) | Validity::Bits { len, .. } => *len,
+        }
+    }
+
+    /// True if the mask covers no values
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+
+    /// Number of null values
+    pub fn null_count(&self) -> usize {
+        match self {
+            Validity::AllValid(_) => 0,
+            Validity::Bits { words, len } => {
+                len - words.iter().map(|w| w.count_ones() as usize).sum::<usize>()
+            }
+        }
+    }
+
+    /// Whether value `i` is valid
+    pub fn is_valid(&self, i: usize) -> bool {
+        match self {
+            Validity::AllValid(len) => i < *len,
+            Validity::Bits { words, len } => i < *len && (words[i >> 6] >> (i & 63)) & 1 == 1,
+        }
+    }
+
+    /// The packed bits as `ceil(len / 8)` bytes, least significant bit first
+    pub fn to_bytes(&self) -> Vec<u8> {
+        match self {
+            Validity::AllValid(len) => {
+                let mut bytes = vec![u8::MAX; len.div_ceil(8)];
+                if let (Some(last), 1..=7) = (bytes.last_mut(), len % 8) {
+                    *last = (1u8 << (len % 8)) - 1;
+                }
+                bytes
+            }
+            Validity::Bits { words, len } => words
+                .iter()
+                .flat_map(|w| w.to_le_bytes())
+                .take(len.div_ceil(8))
+                .collect(),
+        }
+    }
+
+    /// Clear every entry of `bitmap` whose bit is unset; a no-op for
+    /// `AllValid`. `bitmap` must be as long as the mask.
+    pub(crate) fn narrow(&self, bitmap: &mut [bool]) {
+        debug_assert_eq!(bitmap.len(), self.len());
+        if let Validity::Bits { words, .. } = self {
+            for (chunk, &word) in bitmap.chunks_mut(64).zip(words) {
+                if word == u64::MAX {
+                    continue;
+                }
+                for (bit, valid) in chunk.iter_mut().enumerate() {
+                    *valid &= (word >> bit) & 1 == 1;
+                }
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_validity_packing() {
+        let all = Validity::from_bools(&[true; 70]);
+        assert_eq!(all, Validity::AllValid(70));
+        assert_eq!(all.null_count(), 0);
+        assert_eq!(all.to_bytes().len(), 9);
+        assert_eq!(all.to_bytes()[8], 0b0011_1111);
+        assert_eq!(Validity::from_packed_bytes(&all.to_bytes(), 70), Ok(all));
+
+        let mask: Vec<bool> = (0..70).map(|i| i % 3 != 0).collect();
+        let packed = Validity::from_bools(&mask);
+        assert_eq!(packed.null_count(), 24);
+        assert!((0..70).all(|i| packed.is_valid(i) == mask[i]));
+        assert!(!packed.is_valid(70));
+        let bytes = packed.to_bytes();
+        assert_eq!(bytes[0], 0b1011_0110);
+        assert_eq!(Validity::from_packed_bytes(&bytes, 70), Ok(packed.clone()));
+
+        let mut bitmap = vec![true; 70];
+        bitmap[1] = false;
+        packed.narrow(&mut bitmap);
+        assert_eq!(bitmap.iter().filter(|&&b| !b).count(), 25);
+
+        // Set padding bits are ignored, wrong lengths are rejected
+        assert_eq!(
+            Validity::from_packed_bytes(&[0xFF], 3),
+            Ok(Validity::AllValid(3))
+        );
+        assert_eq!(
+            Validity::from_packed_bytes(&[0b1101], 3)
+                .unwrap()
+                .null_count(),
+            1
+        );
+        assert!(Validity::from_packed_bytes(&[1, 0, 1], 3).is_err());
+        assert_eq!(Validity::from_bools(&[]), Validity::AllValid(0));
+    }
+}
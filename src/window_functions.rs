@@ -260,29 +260,25 @@ impl WindowFunction {
             .get_column(order_by_col_name)
             .ok_or_else(|| VeloxxError::ColumnNotFound(order_by_col_name.clone()))?;
 
-        let mut indexed_values: Vec<(usize, Option<Value>)> = (0..row_count)
-            .map(|i| (i, (*order_by_series).get_value(i)))
-            .collect();
-
-        use rayon::prelude::*;
-        indexed_values
-            .par_sort_by(|(_, a), (_, b)| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+        // Argsort row indices on the typed column, then scatter ranks back
+        // through the permutation; no per-row `Value` is materialized
+        let order = Self::argsort(order_by_series, row_count);
+        let same = |a: usize, b: usize| Self::same_key(order_by_series, a, b);
 
         let mut rankings = vec![None; row_count];
         match function {
             RankingFunction::RowNumber => {
-                for (i, (original_index, _)) in indexed_values.iter().enumerate() {
-                    rankings[*original_index] = Some((i + 1) as i32);
+                for (position, &row) in order.iter().enumerate() {
+                    rankings[row] = Some((position + 1) as i32);
                 }
             }
             RankingFunction::Rank => {
                 let mut rank = 1;
                 let mut i = 0;
-                while i < indexed_values.len() {
-                    let (_, current_value) = &indexed_values[i];
+                while i < order.len() {
                     let mut j = i;
-                    while j < indexed_values.len() && &indexed_values[j].1 == current_value {
-                        rankings[indexed_values[j].0] = Some(rank);
+                    while j < order.len() && same(order[j], order[i]) {
+                        rankings[order[j]] = Some(rank);
                         j += 1;
                     }
                     rank += (j - i) as i32;
@@ -292,11 +288,10 @@ impl WindowFunction {
             RankingFunction::DenseRank => {
                 let mut dense_rank = 1;
                 let mut i = 0;
-                while i < indexed_values.len() {
-                    let (_, current_value) = &indexed_values[i];
+                while i < order.len() {
                     let mut j = i;
-                    while j < indexed_values.len() && &indexed_values[j].1 == current_value {
-                        rankings[indexed_values[j].0] = Some(dense_rank);
+                    while j < order.len() && same(order[j], order[i]) {
+                        rankings[order[j]] = Some(dense_rank);
                         j += 1;
                     }
                     dense_rank += 1;
@@ -306,16 +301,15 @@ impl WindowFunction {
             RankingFunction::PercentRank => {
                 let mut rank = 1;
                 let mut i = 0;
-                while i < indexed_values.len() {
-                    let (_, current_value) = &indexed_values[i];
+                while i < order.len() {
                     let mut j = i;
-                    while j < indexed_values.len() && &indexed_values[j].1 == current_value {
+                    while j < order.len() && same(order[j], order[i]) {
                         let percent_rank = if row_count > 1 {
                             (rank - 1) as f64 / (row_count - 1) as f64
                         } else {
                             0.0
                         };
-                        rankings[indexed_values[j].0] = Some((percent_rank * 100.0) as i32);
+                        rankings[order[j]] = Some((percent_rank * 100.0) as i32);
                         j += 1;
                     }
                     rank += (j - i) as i32;
@@ -326,6 +320,56 @@ impl WindowFunction {
         Ok(rankings)
     }
 
+    /// Stable argsort of the first `row_count` rows, nulls first. Incomparable
+    /// floats (NaN) compare as equal, as with `Value`'s partial ordering.
+    fn argsort(series: &Series, row_count: usize) -> Vec<usize> {
+        use rayon::prelude::*;
+        use std::cmp::Ordering;
+
+        fn by_key<T>(
+            order: &mut [usize],
+            values: &[T],
+            validity: &[bool],
+            cmp: impl Fn(&T, &T) -> Ordering + Sync,
+        ) where
+            T: Sync,
+        {
+            order.par_sort_by(|&a, &b| match (validity[a], validity[b]) {
+                (true, true) => cmp(&values[a], &values[b]),
+                (valid_a, valid_b) => valid_a.cmp(&valid_b),
+            });
+        }
+
+        let mut order: Vec<usize> = (0..row_count).collect();
+        match series {
+            Series::I32(_, values, validity) => by_key(&mut order, values, validity, Ord::cmp),
+            Series::F64(_, values, validity) => by_key(&mut order, values, validity, |a, b| {
+                a.partial_cmp(b).unwrap_or(Ordering::Equal)
+            }),
+            Series::Bool(_, values, validity) => by_key(&mut order, values, validity, Ord::cmp),
+            Series::String(_, values, validity) => by_key(&mut order, values, validity, Ord::cmp),
+            Series::DateTime(_, values, validity) => by_key(&mut order, values, validity, Ord::cmp),
+        }
+        order
+    }
+
+    /// Whether two rows hold the same key (nulls equal each other; floats bitwise)
+    fn same_key(series: &Series, a: usize, b: usize) -> bool {
+        fn same<T: PartialEq>(values: &[T], validity: &[bool], a: usize, b: usize) -> bool {
+            validity[a] == validity[b] && (!validity[a] || values[a] == values[b])
+        }
+        match series {
+            Series::I32(_, values, validity) => same(values, validity, a, b),
+            Series::F64(_, values, validity) => {
+                validity[a] == validity[b]
+                    && (!validity[a] || values[a].to_bits() == values[b].to_bits())
+            }
+            Series::Bool(_, values, validity) => same(values, validity, a, b),
+            Series::String(_, values, validity) => same(values, validity, a, b),
+            Series::DateTime(_, values, validity) => same(values, validity, a, b),
+        }
+    }
+
     /// Apply an aggregate function over a window
     ///
     /// # Arguments
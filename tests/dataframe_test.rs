@@ -1,4 +1,5 @@
 use veloxx::dataframe::DataFrame;
+use veloxx::series::validity::Validity;
 use veloxx::series::Series;
 use veloxx::types::Value;
 
@@ -102,3 +103,173 @@ fn test_get_nonexistent_column() {
     let df = DataFrame::new(columns).unwrap();
     assert!(df.get_column("colX").is_none());
 }
+
+#[test]
+fn test_groupby_agg_sum_integer_keys() {
+    // Dense key span (direct-indexed path) with nulls in both columns
+    let mut columns = HashMap::new();
+    columns.insert(
+        "group".to_string(),
+        Series::new_i32(
+            "group",
+            vec![Some(2), Some(1), Some(2), None, Some(1), Some(2)],
+        ),
+    );
+    columns.insert(
+        "value".to_string(),
+        Series::new_f64(
+            "value",
+            vec![Some(1.0), Some(2.0), Some(3.0), Some(4.0), None, Some(5.0)],
+        ),
+    );
+    let df = DataFrame::new(columns).unwrap();
+    let result = df
+        .groupby_agg(vec!["group".to_string()], vec![("value", "sum")])
+        .unwrap();
+    let groups = result.get_column("group").unwrap();
+    let sums = result.get_column("value").unwrap();
+    assert_eq!(result.row_count(), 2);
+    assert_eq!(groups.get_value(0), Some(Value::I32(1)));
+    assert_eq!(sums.get_value(0), Some(Value::F64(2.0)));
+    assert_eq!(groups.get_value(1), Some(Value::I32(2)));
+    assert_eq!(sums.get_value(1), Some(Value::F64(9.0)));
+
+    // Sparse keys fall back to hashing and give the same shape of result
+    let mut columns = HashMap::new();
+    columns.insert(
+        "group".to_string(),
+        Series::new_i32("group", vec![Some(1_000_000), Some(-5), Some(1_000_000)]),
+    );
+    columns.insert(
+        "value".to_string(),
+        Series::new_f64("value", vec![Some(1.5), Some(2.0), Some(0.5)]),
+    );
+    let df = DataFrame::new(columns).unwrap();
+    let result = df
+        .groupby_agg(vec!["group".to_string()], vec![("value", "sum")])
+        .unwrap();
+    assert_eq!(
+        result.get_column("group").unwrap().get_value(1),
+        Some(Value::I32(1_000_000))
+    );
+    assert_eq!(
+        result.get_column("value").unwrap().get_value(1),
+        Some(Value::F64(2.0))
+    );
+}
+
+#[test]
+fn test_group_by_dictionary_encoded_keys() {
+    let mut columns = HashMap::new();
+    columns.insert(
+        "city".to_string(),
+        Series::new_string(
+            "city",
+            vec![
+                Some("A".to_string()),
+                Some("B".to_string()),
+                Some("A".to_string()),
+                None,
+                Some("B".to_string()),
+            ],
+        ),
+    );
+    columns.insert(
+        "kind".to_string(),
+        Series::new_string(
+            "kind",
+            vec![
+                Some("x".to_string()),
+                Some("x".to_string()),
+                Some("y".to_string()),
+                Some("x".to_string()),
+                Some("x".to_string()),
+            ],
+        ),
+    );
+    columns.insert(
+        "value".to_string(),
+        Series::new_i32("value", vec![Some(1), Some(2), Some(3), Some(4), Some(5)]),
+    );
+    let df = DataFrame::new(columns).unwrap();
+
+    let result = df
+        .group_by(vec!["city".to_string()])
+        .unwrap()
+        .agg(vec![("value", "count")])
+        .unwrap();
+    assert_eq!(result.row_count(), 3);
+
+    let result = df
+        .group_by(vec!["city".to_string(), "kind".to_string()])
+        .unwrap()
+        .agg(vec![("value", "count")])
+        .unwrap();
+    assert_eq!(result.row_count(), 4);
+
+    assert!(df.group_by(vec!["missing".to_string()]).is_err());
+}
+
+#[test]
+fn test_describe_numeric_summary() {
+    let mut columns = HashMap::new();
+    columns.insert(
+        "age".to_string(),
+        Series::new_i32("age", vec![Some(20), Some(30), Some(25), None, Some(35)]),
+    );
+    let df = DataFrame::new(columns).unwrap();
+    let summary = df.describe().unwrap();
+
+    assert_eq!(
+        summary.get_column("mean").unwrap().get_value(0),
+        Some(Value::F64(27.5))
+    );
+    let std = summary.get_column("std").unwrap().get_value(0);
+    assert!(matches!(std, Some(Value::F64(s)) if (s - 6.454972243679028).abs() < 1e-12));
+    assert_eq!(
+        summary.get_column("min").unwrap().get_value(0),
+        Some(Value::String("I32(20)".to_string()))
+    );
+    assert_eq!(
+        summary.get_column("max").unwrap().get_value(0),
+        Some(Value::String("I32(35)".to_string()))
+    );
+    let quartiles: Vec<_> = ["25%", "median", "75%"]
+        .iter()
+        .map(|label| summary.get_column(label).unwrap().get_value(0))
+        .collect();
+    assert_eq!(
+        quartiles,
+        vec![
+            Some(Value::String("F64(23.75)".to_string())),
+            Some(Value::String("F64(27.5)".to_string())),
+            Some(Value::String("F64(31.25)".to_string())),
+        ]
+    );
+    // Series percentiles use the same interpolation as describe
+    let age = df.get_column("age").unwrap();
+    assert_eq!(age.percentile(25.0).unwrap(), Some(Value::F64(23.75)));
+    assert_eq!(age.quantile(0.75).unwrap(), Some(Value::F64(31.25)));
+}
+
+#[test]
+fn test_series_validity_masks() {
+    let series = Series::new_i32("x", vec![Some(1), None, Some(3)]);
+    assert_eq!(series.validity_bits(), vec![0b101]);
+    assert_eq!(series.null_count(), 1);
+    assert_eq!(
+        Series::new_f64("y", vec![Some(1.0); 9]).validity(),
+        Validity::AllValid(9)
+    );
+
+    let masked = series.clone().with_validity(&[true, true, false]).unwrap();
+    assert_eq!(masked.get_value(1), None);
+    assert_eq!(masked.get_value(2), None);
+    assert_eq!(masked.get_value(0), Some(Value::I32(1)));
+
+    let masked = series.clone().with_validity_bits(&[0b111]).unwrap();
+    assert_eq!(masked.validity_bits(), vec![0b101]);
+    // One byte per row is not a packed bitmap
+    assert!(series.clone().with_validity_bits(&[1, 0, 1]).is_err());
+    assert!(series.with_validity(&[true]).is_err());
+}
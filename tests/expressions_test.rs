@@ -41,3 +41,54 @@ fn test_complex_expression() {
 
     // assert_eq!(result, Series::new_bool("a", vec![Some(true), Some(true)]));
 }
+
+#[test]
+fn test_fused_expression_across_chunks() {
+    use veloxx::types::Value;
+
+    let n = 3000;
+    let mut columns = HashMap::new();
+    columns.insert(
+        "x".to_string(),
+        Series::new_f64("x", (0..n).map(|i| Some(i as f64 * 0.5)).collect()),
+    );
+    columns.insert(
+        "k".to_string(),
+        Series::new_i32("k", (0..n).map(|i| Some((i % 10) as i32)).collect()),
+    );
+    columns.insert(
+        "z".to_string(),
+        Series::new_i32("z", (0..n).map(|i| Some((i % 3) as i32)).collect()),
+    );
+    let df = DataFrame::new(columns).unwrap();
+
+    // (x * 2.0 > 100.0) AND NOT (k == 3)
+    let expr = Expr::And(
+        Box::new(Expr::GreaterThan(
+            Box::new(Expr::Multiply(
+                Box::new(Expr::Column("x".to_string())),
+                Box::new(Expr::Literal(Value::F64(2.0))),
+            )),
+            Box::new(Expr::Literal(Value::F64(100.0))),
+        )),
+        Box::new(Expr::Not(Box::new(Expr::Equals(
+            Box::new(Expr::Column("k".to_string())),
+            Box::new(Expr::Literal(Value::I32(3))),
+        )))),
+    );
+    let result = df.with_column("flag", &expr).unwrap();
+    let expected = Series::new_bool(
+        "flag",
+        (0..n)
+            .map(|i| Some(i as f64 > 100.0 && i % 10 != 3))
+            .collect(),
+    );
+    assert_eq!(result.get_column("flag").unwrap(), &expected);
+
+    // Division by zero is still reported
+    let expr = Expr::Divide(
+        Box::new(Expr::Column("k".to_string())),
+        Box::new(Expr::Column("z".to_string())),
+    );
+    assert!(df.with_column("ratio", &expr).is_err());
+}
@@ -166,3 +166,42 @@ fn test_from_csv_malformed() {
         )
     );
 }
+
+#[cfg(feature = "arrow")]
+#[test]
+fn test_dataframe_to_from_ipc() {
+    let mut columns = HashMap::new();
+    columns.insert(
+        "id".to_string(),
+        Series::new_i32("id", vec![Some(1), None, Some(3)]),
+    );
+    columns.insert(
+        "score".to_string(),
+        Series::new_f64("score", vec![Some(1.5), Some(2.5), None]),
+    );
+    columns.insert(
+        "name".to_string(),
+        Series::new_string(
+            "name",
+            vec![Some("a".to_string()), None, Some("c".to_string())],
+        ),
+    );
+    let df = DataFrame::new(columns).unwrap();
+
+    // Unique per process so concurrent runs sharing a temp dir don't collide
+    let path = std::env::temp_dir().join(format!(
+        "veloxx_{}_test_dataframe_to_from_ipc.arrow",
+        std::process::id()
+    ));
+    let path = path.to_str().unwrap();
+    let written = df.to_ipc(path);
+    let read = written.and_then(|_| DataFrame::from_ipc(path));
+    // Clean up before any assertion can fail
+    let _ = std::fs::remove_file(path);
+    let read_df = read.unwrap();
+
+    assert_eq!(read_df.row_count(), 3);
+    for name in ["id", "score", "name"] {
+        assert_eq!(read_df.get_column(name), df.get_column(name));
+    }
+}
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import veloxx
 
@@ -133,8 +134,8 @@ class TestPyDataFrame:
         """Test performance with larger datasets"""
         # Create a larger dataset to test SIMD performance
         size = 10000
-        large_series1 = veloxx.PySeries("large1", list(range(size)))
-        large_series2 = veloxx.PySeries("large2", [x * 2.0 for x in range(size)])
+        large_series1 = veloxx.PySeries("large1", np.arange(size, dtype=np.int32))
+        large_series2 = veloxx.PySeries("large2", np.arange(size, dtype=np.float64) * 2.0)
         large_df = veloxx.PyDataFrame({"large1": large_series1, "large2": large_series2})
         
         # Test filtering performance
@@ -142,7 +143,7 @@ class TestPyDataFrame:
         assert filtered.row_count() == size - 5001  # Elements > 5000
         
         # Test grouping performance (create groups)
-        group_series = veloxx.PySeries("group", [i % 10 for i in range(size)])  # 10 groups
+        group_series = veloxx.PySeries("group", np.arange(size, dtype=np.int32) % 10)  # 10 groups
         large_df_grouped = veloxx.PyDataFrame({
             "group": group_series, 
             "value": large_series1
@@ -156,17 +157,16 @@ class TestPyDataFrame:
 class TestHighPerformanceOperations:
     def test_simd_operations_direct(self):
         """Test direct SIMD operations from Python"""
-        a = [1.0, 2.0, 3.0, 4.0, 5.0] * 1000  # Larger array for SIMD
-        b = [1.0, 1.0, 1.0, 1.0, 1.0] * 1000
+        a = np.tile([1.0, 2.0, 3.0, 4.0, 5.0], 1000)  # Larger array for SIMD
+        b = np.ones(5000)
         
         # Test SIMD addition
         result = veloxx.simd_add_f64(a, b)
-        expected = [x + y for x, y in zip(a, b)]
-        assert result == expected
+        np.testing.assert_allclose(np.asarray(result), a + b, rtol=1e-12)
         
         # Test SIMD sum
         sum_result = veloxx.simd_sum_f64(a)
-        expected_sum = sum(a)
+        expected_sum = a.sum()
         assert abs(sum_result - expected_sum) < 1e-10
 
     def test_csv_reading_performance(self):
@@ -201,7 +201,7 @@ class TestHighPerformanceOperations:
         python_time = time.time() - start
         
         # Verify results are the same
-        assert result_simd == result_python
+        np.testing.assert_allclose(np.asarray(result_simd), np.asarray(result_python), rtol=1e-12)
         
         # SIMD should be faster (this might vary by system)
         print(f"SIMD time: {simd_time:.6f}s, Python time: {python_time:.6f}s")
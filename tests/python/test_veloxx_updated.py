@@ -158,6 +158,18 @@ class TestPyDataFrame:
         cov = df.covariance("col1", "col2")
         assert cov == pytest.approx(-2.5, abs=1e-6)
 
+    def test_dataframe_correlation_then_covariance(self):
+        s1 = veloxx.PySeries("col1", [1.0, 2.0, 3.0, 4.0, 5.0])
+        s2 = veloxx.PySeries("col2", [2.0, 4.0, 7.0, 8.0, 10.0])
+        df = veloxx.PyDataFrame({"col1": s1, "col2": s2})
+
+        # The second statistic (and the swapped pair) reuse the cached moments
+        corr = df.correlation("col1", "col2")
+        assert df.covariance("col2", "col1") == pytest.approx(5.0, abs=1e-9)
+        assert df.correlation("col2", "col1") == pytest.approx(corr, abs=1e-12)
+        with pytest.raises(ValueError):
+            df.covariance("col1", "missing")
+
     def test_dataframe_group_by(self):
         s1 = veloxx.PySeries("group", ["A", "B", "A", "B"])
         s2 = veloxx.PySeries("value", [1.0, 2.0, 3.0, 4.0])
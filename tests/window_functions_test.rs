@@ -65,6 +65,33 @@ fn test_row_number() {
     assert_eq!(rank_series.get_value(3), Some(veloxx::types::Value::I32(4)));
 }
 
+#[test]
+fn test_row_number_with_ties_and_nulls() {
+    let mut columns = HashMap::new();
+    columns.insert(
+        "code".to_string(),
+        Series::new_i32("code", vec![Some(5), None, Some(2), Some(5), Some(2)]),
+    );
+    let df = DataFrame::new(columns).unwrap();
+    let window_spec = WindowSpec::new().order_by(vec!["code".to_string()]);
+
+    let result =
+        WindowFunction::apply_ranking(&df, &RankingFunction::RowNumber, &window_spec).unwrap();
+    let row_number = result.get_column("row_number_rank").unwrap();
+    // Nulls sort first and ties keep their original order
+    let expected = [4, 1, 2, 5, 3];
+    for (i, &n) in expected.iter().enumerate() {
+        assert_eq!(row_number.get_value(i), Some(veloxx::types::Value::I32(n)));
+    }
+
+    let result = WindowFunction::apply_ranking(&df, &RankingFunction::Rank, &window_spec).unwrap();
+    let rank = result.get_column("rank_rank").unwrap();
+    let expected = [4, 1, 2, 4, 2];
+    for (i, &n) in expected.iter().enumerate() {
+        assert_eq!(rank.get_value(i), Some(veloxx::types::Value::I32(n)));
+    }
+}
+
 #[test]
 fn test_lag() {
     let mut columns = HashMap::new();